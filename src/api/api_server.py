@@ -21,11 +21,13 @@ This separation allows for distributed processing, better resource allocation,
 and more flexibility in deployment.
 """
 import asyncio
+import itertools
 import json
 import logging
+import queue
 import threading
 import time
-from typing import Dict, List, Optional, Union
+from typing import Dict, Optional, Union
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
@@ -80,8 +82,19 @@ class APIServer:
         # Storage for active WebSocket connections
         self.active_connections: Dict[str, WebSocket] = {}
 
-        # Storage for transcriptions to be sent over WebSockets
-        self.transcription_queue: List[Dict] = []
+        # Counter for session and connection IDs; unlike timestamps these
+        # never collide when two clients arrive within the same second
+        self._id_counter = itertools.count(1)
+
+        # Transcriptions to be sent over WebSockets, drained by a single
+        # long-lived sender thread rather than a new thread per transcription
+        self.transcription_queue: "queue.SimpleQueue[Dict]" = queue.SimpleQueue()
+        self._sender_thread = threading.Thread(
+            target=self._process_transcription_queue,
+            daemon=True,
+            name="transcription-sender",
+        )
+        self._sender_thread.start()
 
         # Flag to track if the server is running
         self.running = False
@@ -135,7 +148,7 @@ class APIServer:
             """
             try:
                 # Send the request to the state's prompt queue
-                session_id = request.session_id or f"session_{int(time.time())}"
+                session_id = request.session_id or f"session_{next(self._id_counter)}"
 
                 # Create a mock assistant response
                 response = AssistantResponse(
@@ -163,7 +176,7 @@ class APIServer:
             await websocket.accept()
 
             # Generate a unique connection ID
-            connection_id = f"conn_{int(time.time())}"
+            connection_id = f"conn_{next(self._id_counter)}"
             self.active_connections[connection_id] = websocket
 
             try:
@@ -198,15 +211,17 @@ class APIServer:
             "timestamp": time.time()
         }
 
-        self.transcription_queue.append(transcription)
-
-        # Process the queue asynchronously
-        threading.Thread(target=self._process_transcription_queue, daemon=True).start()
+        self.transcription_queue.put(transcription)
 
     def _process_transcription_queue(self):
         """Process the transcription queue and send to WebSocket clients."""
-        while self.transcription_queue:
-            transcription = self.transcription_queue.pop(0)
+        # One event loop serves every send from this thread
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        while True:
+            # Block until the next transcription arrives
+            transcription = self.transcription_queue.get()
 
             # Convert to JSON
             json_data = json.dumps(transcription)
@@ -215,8 +230,6 @@ class APIServer:
             for connection_id, websocket in list(self.active_connections.items()):
                 try:
                     # Use run_until_complete to run the coroutine synchronously
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
                     loop.run_until_complete(websocket.send_text(json_data))
                 except Exception as e:
                     logger.error(f"Error sending to WebSocket {connection_id}: {e}")
@@ -8,14 +8,17 @@ This can be run on a separate machine from the main voice control system.
 
 import asyncio
 import base64
+import io
 import json
 import logging
 import os
 import tempfile
 import time
 import uuid
+import wave
 from typing import Dict, List, Optional, Union
 
+import numpy as np
 import torch
 import uvicorn
 import whisper
@@ -23,6 +26,15 @@ from fastapi import FastAPI, File, HTTPException, UploadFile, WebSocket, WebSock
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
+# orjson parses the large base64 audio messages much faster than the
+# standard library; its decode error subclasses json.JSONDecodeError
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -30,6 +42,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger("speech-recognition-api")
 
+# Keep torch's thread defaults unless TORCH_NUM_THREADS asks for a limit,
+# e.g. when the server shares the machine with other CPU-heavy work
+if os.getenv("TORCH_NUM_THREADS"):
+    torch.set_num_threads(int(os.getenv("TORCH_NUM_THREADS")))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set before torch starts any inter-op work
+        pass
+
+
+def _decode_wav(audio_bytes: bytes) -> Optional[np.ndarray]:
+    """Decode WAV data that is already in Whisper's input format.
+
+    Whisper otherwise runs ffmpeg to decode and resample every file, which
+    is wasted work for the 16 kHz mono 16-bit audio the clients record.
+
+    Args:
+        audio_bytes: Raw bytes of the uploaded audio file
+
+    Returns:
+        Float32 samples in [-1, 1], or None if the audio needs ffmpeg
+    """
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wav:
+            if (
+                wav.getnchannels() != 1
+                or wav.getsampwidth() != 2
+                or wav.getframerate() != whisper.audio.SAMPLE_RATE
+            ):
+                return None
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+
+    return np.frombuffer(frames, np.int16).astype(np.float32) / 32768.0
+
+
 # Models for API
 class TranscriptionRequest(BaseModel):
     """Request model for transcription."""
@@ -112,51 +162,35 @@ class SpeechRecognitionAPI:
                 # Decode the audio data
                 audio_data = base64.b64decode(request.audio_data)
 
-                # Save to a temporary file
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-                temp_file.write(audio_data)
-                temp_file.close()
-
-                try:
-                    # Time the transcription
-                    start_time = time.time()
-
-                    # Transcribe the audio
-                    result = model.transcribe(
-                        temp_file.name,
-                        language=request.language,
-                        initial_prompt=request.prompt,
-                    )
-
-                    # Calculate processing time
-                    processing_time = time.time() - start_time
-
-                    # Extract the results
-                    text = result["text"].strip()
-                    confidence = result.get("confidence", 1.0)
-                    language = result.get("language")
-                    segments = result.get("segments")
-
-                    # Clean up the temporary file
-                    os.unlink(temp_file.name)
-
-                    # Force memory cleanup
-                    torch.cuda.empty_cache() if hasattr(
-                        torch, "cuda"
-                    ) and torch is not None else None
-
-                    return TranscriptionResponse(
-                        text=text,
-                        confidence=confidence,
-                        language=language,
-                        segments=segments,
-                        processing_time=processing_time,
-                    )
-                except Exception as e:
-                    # Clean up the temporary file
-                    if os.path.exists(temp_file.name):
-                        os.unlink(temp_file.name)
-                    raise e
+                # Time the transcription
+                start_time = time.time()
+
+                # Transcribe the audio
+                result = self.transcribe_audio(
+                    model, audio_data, request.language, request.prompt
+                )
+
+                # Calculate processing time
+                processing_time = time.time() - start_time
+
+                # Extract the results
+                text = result["text"].strip()
+                confidence = result.get("confidence", 1.0)
+                language = result.get("language")
+                segments = result.get("segments")
+
+                # Force memory cleanup
+                torch.cuda.empty_cache() if hasattr(
+                    torch, "cuda"
+                ) and torch is not None else None
+
+                return TranscriptionResponse(
+                    text=text,
+                    confidence=confidence,
+                    language=language,
+                    segments=segments,
+                    processing_time=processing_time,
+                )
             except Exception as e:
                 logger.error(f"Error transcribing audio: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
@@ -184,51 +218,35 @@ class SpeechRecognitionAPI:
                 model_size = model_size or self.default_model_size
                 model = await self.get_model(model_size)
 
-                # Save to a temporary file
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-                temp_file.write(await file.read())
-                temp_file.close()
-
-                try:
-                    # Time the transcription
-                    start_time = time.time()
-
-                    # Transcribe the audio
-                    result = model.transcribe(
-                        temp_file.name,
-                        language=language,
-                        initial_prompt=prompt,
-                    )
-
-                    # Calculate processing time
-                    processing_time = time.time() - start_time
-
-                    # Extract the results
-                    text = result["text"].strip()
-                    confidence = result.get("confidence", 1.0)
-                    language = result.get("language")
-                    segments = result.get("segments")
-
-                    # Clean up the temporary file
-                    os.unlink(temp_file.name)
-
-                    # Force memory cleanup
-                    torch.cuda.empty_cache() if hasattr(
-                        torch, "cuda"
-                    ) and torch is not None else None
-
-                    return TranscriptionResponse(
-                        text=text,
-                        confidence=confidence,
-                        language=language,
-                        segments=segments,
-                        processing_time=processing_time,
-                    )
-                except Exception as e:
-                    # Clean up the temporary file
-                    if os.path.exists(temp_file.name):
-                        os.unlink(temp_file.name)
-                    raise e
+                audio_data = await file.read()
+
+                # Time the transcription
+                start_time = time.time()
+
+                # Transcribe the audio
+                result = self.transcribe_audio(model, audio_data, language, prompt)
+
+                # Calculate processing time
+                processing_time = time.time() - start_time
+
+                # Extract the results
+                text = result["text"].strip()
+                confidence = result.get("confidence", 1.0)
+                language = result.get("language")
+                segments = result.get("segments")
+
+                # Force memory cleanup
+                torch.cuda.empty_cache() if hasattr(
+                    torch, "cuda"
+                ) and torch is not None else None
+
+                return TranscriptionResponse(
+                    text=text,
+                    confidence=confidence,
+                    language=language,
+                    segments=segments,
+                    processing_time=processing_time,
+                )
             except Exception as e:
                 logger.error(f"Error transcribing audio file: {e}")
                 raise HTTPException(status_code=500, detail=str(e))
@@ -269,7 +287,7 @@ class SpeechRecognitionAPI:
 
                     try:
                         # Parse JSON message
-                        message = json.loads(data)
+                        message = _json_loads(data)
                         audio_data = message.get("audio_data")
 
                         if not audio_data:
@@ -279,20 +297,13 @@ class SpeechRecognitionAPI:
                         # Decode the audio data
                         audio_bytes = base64.b64decode(audio_data)
 
-                        # Save to a temporary file
-                        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-                        temp_file.write(audio_bytes)
-                        temp_file.close()
-
                         try:
                             # Time the transcription
                             start_time = time.time()
 
                             # Transcribe the audio
-                            result = model.transcribe(
-                                temp_file.name,
-                                language=language,
-                                initial_prompt=prompt,
+                            result = self.transcribe_audio(
+                                model, audio_bytes, language, prompt
                             )
 
                             # Calculate processing time
@@ -304,9 +315,6 @@ class SpeechRecognitionAPI:
                             detected_language = result.get("language")
                             segments = result.get("segments")
 
-                            # Clean up the temporary file
-                            os.unlink(temp_file.name)
-
                             # Force memory cleanup
                             torch.cuda.empty_cache() if hasattr(
                                 torch, "cuda"
@@ -321,10 +329,6 @@ class SpeechRecognitionAPI:
                                 "processing_time": processing_time,
                             })
                         except Exception as e:
-                            # Clean up the temporary file
-                            if os.path.exists(temp_file.name):
-                                os.unlink(temp_file.name)
-
                             # Send error
                             await websocket.send_json({"error": str(e)})
                     except json.JSONDecodeError:
@@ -336,6 +340,44 @@ class SpeechRecognitionAPI:
             except Exception as e:
                 logger.error(f"WebSocket error: {e}")
 
+    def transcribe_audio(
+        self,
+        model: whisper.Whisper,
+        audio_bytes: bytes,
+        language: Optional[str],
+        prompt: Optional[str],
+    ) -> Dict:
+        """Transcribe raw audio file bytes with a Whisper model.
+
+        Args:
+            model: The Whisper model to use
+            audio_bytes: Raw bytes of the audio file
+            language: The language of the audio
+            prompt: Initial prompt for the model
+
+        Returns:
+            The Whisper transcription result
+        """
+        audio = _decode_wav(audio_bytes)
+        if audio is not None:
+            with torch.inference_mode():
+                return model.transcribe(
+                    audio, language=language, initial_prompt=prompt
+                )
+
+        # Other formats go through a temporary file for Whisper to decode
+        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
+        try:
+            temp_file.write(audio_bytes)
+            temp_file.close()
+            with torch.inference_mode():
+                return model.transcribe(
+                    temp_file.name, language=language, initial_prompt=prompt
+                )
+        finally:
+            temp_file.close()
+            os.unlink(temp_file.name)
+
     async def get_model(self, model_size: str) -> whisper.Whisper:
         """Get a Whisper model, loading it if necessary.
 
@@ -365,7 +407,13 @@ class SpeechRecognitionAPI:
             port: The port to bind to
         """
         # Preload the default model
-        asyncio.run(self.get_model(self.default_model_size))
+        model = asyncio.run(self.get_model(self.default_model_size))
+
+        # Run one transcription of silence so the first real request doesn't
+        # pay for one-off setup such as GPU kernel selection
+        logger.info("Warming up Whisper model")
+        with torch.inference_mode():
+            model.transcribe(np.zeros(whisper.audio.SAMPLE_RATE, dtype=np.float32))
 
         # Start the server
         uvicorn.run(self.app, host=host, port=port)
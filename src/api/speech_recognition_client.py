@@ -43,6 +43,30 @@ class SpeechRecognitionClient:
         # Transcription callbacks
         self.transcription_callbacks = []
 
+        # HTTP session reused across requests so the connection to the API is
+        # kept alive; created lazily on the event loop that first uses it
+        self._session = None
+        self._session_loop = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session for the running event loop.
+
+        Returns:
+            The client session, created if needed
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = aiohttp.ClientSession()
+            self._session_loop = loop
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
     async def check_connection(self) -> bool:
         """Check if the API is available.
 
@@ -50,14 +74,14 @@ class SpeechRecognitionClient:
             True if the API is available, False otherwise
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.api_url}/") as response:
-                    if response.status == 200:
-                        logger.info("Speech Recognition API is available")
-                        return True
-                    else:
-                        logger.error(f"Speech Recognition API returned status {response.status}")
-                        return False
+            session = self._get_session()
+            async with session.get(f"{self.api_url}/") as response:
+                if response.status == 200:
+                    logger.info("Speech Recognition API is available")
+                    return True
+                else:
+                    logger.error(f"Speech Recognition API returned status {response.status}")
+                    return False
         except Exception as e:
             logger.error(f"Error connecting to Speech Recognition API: {e}")
             return False
@@ -69,13 +93,13 @@ class SpeechRecognitionClient:
             Dict with available models information
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.api_url}/models") as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        logger.error(f"Error listing models: {response.status}")
-                        return {}
+            session = self._get_session()
+            async with session.get(f"{self.api_url}/models") as response:
+                if response.status == 200:
+                    return await response.json()
+                else:
+                    logger.error(f"Error listing models: {response.status}")
+                    return {}
         except Exception as e:
             logger.error(f"Error listing models: {e}")
             return {}
@@ -121,19 +145,19 @@ class SpeechRecognitionClient:
                 data["prompt"] = prompt
 
             # Send the request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/transcribe",
-                    json=data,
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info(f"Transcription successful: {result.get('text', '')}")
-                        return result
-                    else:
-                        error = await response.text()
-                        logger.error(f"Error transcribing: {response.status} - {error}")
-                        return {"error": error}
+            session = self._get_session()
+            async with session.post(
+                f"{self.api_url}/transcribe",
+                json=data,
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    logger.info(f"Transcription successful: {result.get('text', '')}")
+                    return result
+                else:
+                    error = await response.text()
+                    logger.error(f"Error transcribing: {response.status} - {error}")
+                    return {"error": error}
         except Exception as e:
             logger.error(f"Error transcribing: {e}")
             return {"error": str(e)}
@@ -175,19 +199,19 @@ class SpeechRecognitionClient:
                 data["prompt"] = prompt
 
             # Send the request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/transcribe",
-                    json=data,
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info(f"Transcription successful: {result.get('text', '')}")
-                        return result
-                    else:
-                        error = await response.text()
-                        logger.error(f"Error transcribing: {response.status} - {error}")
-                        return {"error": error}
+            session = self._get_session()
+            async with session.post(
+                f"{self.api_url}/transcribe",
+                json=data,
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    logger.info(f"Transcription successful: {result.get('text', '')}")
+                    return result
+                else:
+                    error = await response.text()
+                    logger.error(f"Error transcribing: {response.status} - {error}")
+                    return {"error": error}
         except Exception as e:
             logger.error(f"Error transcribing: {e}")
             return {"error": str(e)}
@@ -225,19 +249,19 @@ class SpeechRecognitionClient:
                 data.add_field("prompt", prompt)
 
             # Send the request
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/transcribe_file",
-                    data=data,
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        logger.info(f"Transcription successful: {result.get('text', '')}")
-                        return result
-                    else:
-                        error = await response.text()
-                        logger.error(f"Error transcribing: {response.status} - {error}")
-                        return {"error": error}
+            session = self._get_session()
+            async with session.post(
+                f"{self.api_url}/transcribe_file",
+                data=data,
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    logger.info(f"Transcription successful: {result.get('text', '')}")
+                    return result
+                else:
+                    error = await response.text()
+                    logger.error(f"Error transcribing: {response.status} - {error}")
+                    return {"error": error}
         except Exception as e:
             logger.error(f"Error transcribing: {e}")
             return {"error": str(e)}
@@ -22,6 +22,12 @@ from src.api.speech_recognition_client import SpeechRecognitionClient
 
 logger = logging.getLogger("audio-processor")
 
+# LLM actions that mean "start dictation"
+DICTATION_ACTIONS = frozenset(["dictate", "dictation", "type", "write", "text"])
+
+# Words that start dictation when found anywhere in a command transcription
+DICTATION_FRAGMENTS = ("dictate", "dictation", "dict", "type", "write", "text", "note")
+
 
 class AudioProcessor:
     """Processes audio files in the queue and converts to text."""
@@ -87,6 +93,12 @@ class AudioProcessor:
             except Exception as e:
                 logger.error(f"Error disconnecting from speech API websocket: {e}")
 
+            # Close the shared HTTP session
+            try:
+                self.loop.run_until_complete(self.speech_client.close())
+            except Exception as e:
+                logger.error(f"Error closing speech API session: {e}")
+
             # Close the loop
             try:
                 self.loop.close()
@@ -173,9 +185,16 @@ class AudioProcessor:
                     logger.error(f"Unknown audio queue item format: {type(audio_item)}")
                     continue
 
-                if not os.path.exists(audio_file):
-                    logger.error(f"Audio file not found: {audio_file}")
-                    continue
+                # The trigger detector already read trigger mode files, so just
+                # clean them up; removing the file also checks it still exists
+                if is_trigger_mode:
+                    try:
+                        os.unlink(audio_file)
+                    except FileNotFoundError:
+                        logger.error(f"Audio file not found: {audio_file}")
+                        continue
+                    except Exception as unlink_err:
+                        logger.debug(f"Failed to delete temp file: {unlink_err}")
 
                 logger.info(f"Processing audio file: {audio_file}")
 
@@ -189,11 +208,6 @@ class AudioProcessor:
                     logger.debug(
                         "Skipping trigger mode file - already processed by trigger detector"
                     )
-                    # Clean up the audio file
-                    try:
-                        os.unlink(audio_file)
-                    except Exception as unlink_err:
-                        logger.debug(f"Failed to delete temp file: {unlink_err}")
                     continue
 
                 # Always use the Speech Recognition API
@@ -218,6 +232,9 @@ class AudioProcessor:
                     logger.debug(
                         f"API Transcription: '{transcription}', confidence: {confidence:.2f}"
                     )
+                except FileNotFoundError:
+                    logger.error(f"Audio file not found: {audio_file}")
+                    continue
                 except Exception as e:
                     logger.error(f"Error using Speech Recognition API: {e}")
 
@@ -227,11 +244,10 @@ class AudioProcessor:
                     notify_error("Speech recognition API failed. Please check API server.")
 
                     # Clean up if error occurred
-                    if audio_file and os.path.exists(audio_file):
-                        try:
-                            os.unlink(audio_file)
-                        except:
-                            pass
+                    try:
+                        os.unlink(audio_file)
+                    except OSError:
+                        pass
                     continue
 
                 # Clean up the audio file
@@ -315,10 +331,10 @@ class AudioProcessor:
                 notify_error(f"Failed to transcribe audio: {str(e)}")
 
                 # Clean up if error occurred
-                if audio_file and os.path.exists(audio_file):
+                if audio_file:
                     try:
                         os.unlink(audio_file)
-                    except:
+                    except OSError:
                         pass
 
     def _process_command(self, transcription):
@@ -330,15 +346,16 @@ class AudioProcessor:
         Returns:
             bool: True if command was processed successfully
         """
+        # Lowercase once for the LLM and the fragment scan below
+        lowered = transcription.lower()
+
         # First, try LLM interpretation if enabled
         if self.use_llm and self.llm_interpreter.llm is not None:
             # Interpret the command using the LLM
-            command, args = self.llm_interpreter.interpret_command(
-                transcription.lower()
-            )
+            command, args = self.llm_interpreter.interpret_command(lowered)
 
             # For dictation commands, handle those
-            if command in ["dictate", "dictation", "type", "write", "text"]:
+            if command in DICTATION_ACTIONS:
                 logger.info(f"LLM interpreted dictation command: {command}")
                 return self._start_dictation_mode()
             elif command == "none":
@@ -347,16 +364,14 @@ class AudioProcessor:
 
             # Try dynamic response for other cases
             logger.info("Checking for dynamic response")
-            dynamic_response = self.llm_interpreter.generate_dynamic_response(
-                transcription.lower()
-            )
+            dynamic_response = self.llm_interpreter.generate_dynamic_response(lowered)
 
             if dynamic_response.get("is_command", False):
                 action = dynamic_response.get("action", "")
                 logger.info(f"Dynamic interpretation: {action}")
 
                 # In the simplified architecture, we only support dictation
-                if action in ["dictate", "dictation", "type", "write", "text"]:
+                if action in DICTATION_ACTIONS:
                     logger.info(
                         f"LLM interpreter triggered dictation mode with action: '{action}'"
                     )
@@ -368,9 +383,8 @@ class AudioProcessor:
                     return False
 
         # Check for dictation trigger words in transcription directly
-        dictation_fragments = ["dictate", "dictation", "dict", "type", "write", "text", "note"]
-        for fragment in dictation_fragments:
-            if fragment in transcription.lower():
+        for fragment in DICTATION_FRAGMENTS:
+            if fragment in lowered:
                 logger.info(f"Detected dictation command: '{fragment}' in '{transcription}'")
                 return self._start_dictation_mode()
 
@@ -402,7 +416,10 @@ class AudioProcessor:
             from src.audio.trigger_detection import TriggerDetector
 
             detector = TriggerDetector()
-            detector._start_recording_thread("dictation", force=True)
+            try:
+                detector._start_recording_thread("dictation", force=True)
+            finally:
+                detector.close()
             return True
         except Exception as e:
             logger.error(f"Failed to start dictation mode: {e}")
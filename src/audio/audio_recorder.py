@@ -7,7 +7,6 @@ Handles recording from microphone with smart silence detection.
 import os
 import time
 import tempfile
-import subprocess
 import pyaudio
 import wave
 import numpy as np
@@ -15,6 +14,7 @@ import logging
 from typing import Optional, Dict, List, Any
 
 from src.core.state_manager import state
+from src.audio.resource_manager import play_system_sound
 
 logger = logging.getLogger("audio-recorder")
 
@@ -32,24 +32,27 @@ class AudioRecorder:
     def play_sound(self, sound_type: str) -> None:
         """Play a sound to indicate recording status.
 
+        Only the start sound blocks, so it finishes before the microphone
+        opens; the others play in the background while the caller continues.
+
         Args:
             sound_type: Type of sound to play ('start', 'stop', 'dictation', 'command')
         """
         sound_map = {
-            "start": "/System/Library/Sounds/Tink.aiff",  # Higher pitch
-            "stop": "/System/Library/Sounds/Basso.aiff",  # Lower pitch
-            "dictation": "/System/Library/Sounds/Glass.aiff",  # Distinctive for dictation
-            "command": "/System/Library/Sounds/Pop.aiff",  # Distinctive for commands
-            "muted": "/System/Library/Sounds/Submarine.aiff",  # For mute toggle
-            "unmuted": "/System/Library/Sounds/Funk.aiff",  # For unmute toggle
+            "start": "Tink",  # Higher pitch
+            "stop": "Basso",  # Lower pitch
+            "dictation": "Glass",  # Distinctive for dictation
+            "command": "Pop",  # Distinctive for commands
+            "muted": "Submarine",  # For mute toggle
+            "unmuted": "Funk",  # For unmute toggle
         }
 
-        sound_file = sound_map.get(sound_type)
-        if not sound_file:
+        sound_name = sound_map.get(sound_type)
+        if not sound_name:
             return
 
         try:
-            subprocess.run(["afplay", sound_file], check=False)
+            play_system_sound(sound_name, block=sound_type == "start")
         except Exception as e:
             logger.error(f"Could not play {sound_type} sound: {e}")
 
@@ -349,8 +352,10 @@ class AudioRecorder:
                         elapsed_real = current_time - start_time
 
                         logger.debug(
-                            f"Recorded {seconds_recorded:.1f} sec (real: {elapsed_real:.1f}s), "
-                            f"Energy: {energy:.0f}"
+                            "Recorded %.1f sec (real: %.1fs), Energy: %.0f",
+                            seconds_recorded,
+                            elapsed_real,
+                            energy,
                         )
 
                     # Detect speech vs silence
@@ -376,14 +381,16 @@ class AudioRecorder:
                                 if seconds_recorded < min_seconds_required:
                                     # Keep recording even if silence detected
                                     logger.debug(
-                                        f"Ignoring silence detection as we need at least {min_seconds_required}s "
-                                        + f"(currently: {seconds_recorded:.1f}s)"
+                                        "Ignoring silence detection as we need at least %ss (currently: %.1fs)",
+                                        min_seconds_required,
+                                        seconds_recorded,
                                     )
                                     continue
 
                             # OK to stop recording now
                             logger.debug(
-                                f"Stopping recording after detecting {silence_frames/frames_per_second:.1f}s of silence"
+                                "Stopping recording after detecting %.1fs of silence",
+                                silence_frames / frames_per_second,
                             )
                             break
 
@@ -6,6 +6,7 @@ Manages a rolling buffer of audio to detect trigger words.
 
 import time
 import threading
+import itertools
 import pyaudio
 import numpy as np
 import logging
@@ -50,6 +51,12 @@ class ContinuousRecorder:
         self.running = False
         self.thread = None
 
+        # Buffer processing threads still using the trigger detector; once
+        # stop() has been called the last of them closes it
+        self._detector_lock = threading.Lock()
+        self._detector_users = 0
+        self._detector_closing = False
+
     def start(self):
         """Start continuous recording in a background thread."""
         if self.running:
@@ -78,6 +85,39 @@ class ContinuousRecorder:
         if self.thread:
             self.thread.join(2.0)  # Wait up to 2 seconds for thread to end
 
+        # Close the trigger detector now, or leave it to the last buffer
+        # processing thread if one is still using it
+        with self._detector_lock:
+            self._detector_closing = True
+            close_now = self._detector_users == 0
+        if close_now:
+            self.trigger_detector.close()
+        else:
+            logger.debug("Closing trigger detector once buffer processing finishes")
+
+    def _acquire_detector(self):
+        """Register a buffer processing thread as a user of the trigger detector.
+
+        Returns:
+            False if the detector is being closed and must not be used
+        """
+        with self._detector_lock:
+            if self._detector_closing:
+                return False
+            self._detector_users += 1
+            return True
+
+    def _release_detector(self):
+        """Unregister a buffer processing thread.
+
+        The last thread to finish after stop() closes the trigger detector.
+        """
+        with self._detector_lock:
+            self._detector_users -= 1
+            close_now = self._detector_closing and self._detector_users == 0
+        if close_now:
+            self.trigger_detector.close()
+
     def _recording_thread(self):
         """Main recording thread function."""
         logger.debug("Continuous recording thread starting")
@@ -91,6 +131,11 @@ class ContinuousRecorder:
             max_silence_frames = int(self.rate / self.chunk * self.silence_timeout)
             has_speech = False
 
+            # Frames read so far, for periodic energy logging; the buffer
+            # length can't be used since it stops changing once full
+            frames_read = 0
+            energy_log_interval = int(self.frames_per_second * 2)
+
             # Get default input device
             default_input_device_index = p.get_default_input_device_info().get("index")
             logger.debug(
@@ -142,9 +187,12 @@ class ContinuousRecorder:
                     energy = np.abs(audio_data).mean()
 
                     # Log energy occasionally (every 2 seconds approximately)
-                    if len(state.audio_buffer) % int(self.frames_per_second * 2) == 0:
+                    frames_read += 1
+                    if frames_read % energy_log_interval == 0:
                         logger.debug(
-                            f"Audio energy level: {energy:.0f}, buffer size: {len(state.audio_buffer)}"
+                            "Audio energy level: %.0f, buffer size: %d",
+                            energy,
+                            len(state.audio_buffer),
                         )
 
                     # Detect speech activity
@@ -152,13 +200,16 @@ class ContinuousRecorder:
                         # High energy detected - could be speech
                         if not has_speech:
                             logger.debug(
-                                f"Voice activity detected, energy: {energy:.0f}"
+                                "Voice activity detected, energy: %.0f", energy
                             )
                             has_speech = True
                             # Store the current buffer position as the speech start point
                             with state.audio_buffer_lock:
                                 state.speech_start_index = max(0, len(state.audio_buffer) - 1)
-                                logger.debug(f"Speech start marked at buffer index {state.speech_start_index}")
+                                logger.debug(
+                                    "Speech start marked at buffer index %d",
+                                    state.speech_start_index,
+                                )
                         silence_frames = 0
                     else:
                         # Low energy - might be silence
@@ -172,39 +223,42 @@ class ContinuousRecorder:
 
                             if time_since_last < self.min_processing_interval:
                                 logger.debug(
-                                    f"Cooldown active - skipping processing ({time_since_last:.1f}s < {self.min_processing_interval:.1f}s)"
+                                    "Cooldown active - skipping processing (%.1fs < %.1fs)",
+                                    time_since_last,
+                                    self.min_processing_interval,
                                 )
-                                has_speech = False
-                                silence_frames = 0
-                                state.speech_start_index = 0  # Reset speech start index
-                                continue
-
-                            logger.debug(
-                                f"Potential trigger word - processing buffer after {silence_frames/self.frames_per_second:.1f}s silence"
-                            )
-
-                            # Update last processing time
-                            self.last_processing_time = current_time
-
-                            # We need to be careful about setting recording here to prevent race conditions
-                            # Only process if we're not already in recording mode
-                            if not state.is_recording():
-                                # First set recording to True to block other recordings
-                                state.start_recording()
-                                # Process buffer in a separate thread to avoid blocking the continuous recording
-                                process_thread = threading.Thread(
-                                    target=self._process_buffer, daemon=True
-                                )
-                                process_thread.start()
-
-                                # Wait longer before continuing to prevent overlapping processing
-                                # This gives the system time to properly handle the current speech segment
-                                time.sleep(1.5)  # Increased to 1.5 seconds to ensure better separation
+                                # Reset speech start index; the frame just read
+                                # still goes into the buffer below
+                                with state.audio_buffer_lock:
+                                    state.speech_start_index = 0
                             else:
                                 logger.debug(
-                                    "Skipping buffer processing - already recording"
+                                    "Potential trigger word - processing buffer after %.1fs silence",
+                                    silence_frames / self.frames_per_second,
                                 )
 
+                                # Update last processing time
+                                self.last_processing_time = current_time
+
+                                # We need to be careful about setting recording here to prevent race conditions
+                                # Only process if we're not already in recording mode
+                                if not state.is_recording() and self._acquire_detector():
+                                    # First set recording to True to block other recordings
+                                    state.start_recording()
+                                    # Process buffer in a separate thread to avoid blocking the continuous recording
+                                    process_thread = threading.Thread(
+                                        target=self._process_buffer, daemon=True
+                                    )
+                                    process_thread.start()
+
+                                    # Wait longer before continuing to prevent overlapping processing
+                                    # This gives the system time to properly handle the current speech segment
+                                    time.sleep(1.5)  # Increased to 1.5 seconds to ensure better separation
+                                else:
+                                    logger.debug(
+                                        "Skipping buffer processing - already recording or stopping"
+                                    )
+
                             # Reset speech detection
                             has_speech = False
                             # Add a cooldown period to prevent immediate re-triggering
@@ -215,7 +269,7 @@ class ContinuousRecorder:
                         state.audio_buffer.append(data)
                         # Keep buffer at maximum size
                         while len(state.audio_buffer) > self.max_buffer_frames:
-                            state.audio_buffer.pop(0)
+                            state.audio_buffer.popleft()
                             # Adjust speech_start_index if we're removing data
                             if state.speech_start_index > 0:
                                 state.speech_start_index = max(0, state.speech_start_index - 1)
@@ -262,9 +316,11 @@ class ContinuousRecorder:
                 speech_start = state.speech_start_index
                 if speech_start > 0 and speech_start < len(state.audio_buffer):
                     logger.debug(f"Using speech start index {speech_start} for processing")
-                    buffer_copy = state.audio_buffer[speech_start:].copy()
+                    buffer_copy = list(
+                        itertools.islice(state.audio_buffer, speech_start, None)
+                    )
                 else:
-                    buffer_copy = state.audio_buffer.copy()
+                    buffer_copy = list(state.audio_buffer)
 
                 # Reset speech start index for next detection
                 state.speech_start_index = 0
@@ -295,3 +351,6 @@ class ContinuousRecorder:
             # Always reset recording flag and speech start index in case of error
             state.stop_recording()
             state.speech_start_index = 0
+
+        finally:
+            self._release_detector()
@@ -5,11 +5,13 @@ Provides consistent resource handling patterns across modules.
 """
 
 import os
+import subprocess
 import tempfile
+import threading
 import logging
 import pyaudio
 import wave
-from typing import Optional, List, Any, Generator
+from typing import Optional, List, Any, Dict, Generator
 from contextlib import contextmanager
 
 from src.core.error_handler import handle_error
@@ -17,6 +19,31 @@ from src.config.config import config
 
 logger = logging.getLogger("resource-manager")
 
+SYSTEM_SOUNDS_DIR = "/System/Library/Sounds"
+
+
+def _list_system_sounds() -> Dict[str, str]:
+    """Map available system sound names to their paths (empty if unreadable)."""
+    try:
+        return {
+            name.rsplit(".", 1)[0]: SYSTEM_SOUNDS_DIR + "/" + name
+            for name in os.listdir(SYSTEM_SOUNDS_DIR)
+            if name.endswith(".aiff")
+        }
+    except OSError:
+        return {}
+
+
+# The system sounds directory is static, so list it once at import
+_SYSTEM_SOUNDS = _list_system_sounds()
+
+# Absolute path avoids a PATH lookup on every system sound
+AFPLAY_PATH = "/usr/bin/afplay"
+
+# In-flight sound players, reaped lazily on the next play_system_sound call
+_sound_processes: List[subprocess.Popen] = []
+_sound_processes_lock = threading.Lock()
+
 
 @contextmanager
 def audio_device() -> Generator[pyaudio.PyAudio, None, None]:
@@ -79,11 +106,10 @@ class TempAudioFile:
             suffix: File suffix (default: .wav)
             delete: Whether to delete file on cleanup (default: True)
         """
-        self.temp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
-        self.filename = self.temp_file.name
-        self.temp_file.close()
+        fd, self.filename = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
         self._delete = delete
-        logger.debug(f"Created temporary audio file: {self.filename}")
+        logger.debug("Created temporary audio file: %s", self.filename)
 
     def __enter__(self) -> str:
         """Context manager entry point."""
@@ -91,17 +117,56 @@ class TempAudioFile:
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Clean up temporary file on context exit."""
-        if self._delete and os.path.exists(self.filename):
-            try:
-                os.remove(self.filename)
-                logger.debug(f"Removed temporary audio file: {self.filename}")
-            except Exception as e:
-                handle_error(e, logger, "Failed to remove temporary audio file")
+        if not self._delete:
+            return
+        try:
+            os.unlink(self.filename)
+            logger.debug("Removed temporary audio file: %s", self.filename)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            handle_error(e, logger, "Failed to remove temporary audio file")
 
     def keep(self) -> None:
         """Prevent the file from being deleted on cleanup."""
         self._delete = False
-        logger.debug(f"Marked temporary file to keep: {self.filename}")
+        logger.debug("Marked temporary file to keep: %s", self.filename)
+
+
+def _make_writer(
+    filename: str, channels: int, sample_width: int, rate: int
+) -> wave.Wave_write:
+    """
+    Open a WAV writer with its header parameters set.
+
+    The sample width (like channels and rate) is frozen for the lifetime of
+    the writer; the header is patched with the final length on close.
+
+    Args:
+        filename: Output filename
+        channels: Number of channels
+        sample_width: Sample width in bytes
+        rate: Sample rate
+
+    Returns:
+        Open wave.Wave_write instance
+    """
+    writer = wave.open(filename, "wb")
+    writer.setnchannels(channels)
+    writer.setsampwidth(sample_width)
+    writer.setframerate(rate)
+    return writer
+
+
+def _append_frames(writer: wave.Wave_write, frames: List[bytes]) -> None:
+    """
+    Append audio frames to an open WAV writer.
+
+    Args:
+        writer: Writer returned by _make_writer
+        frames: List of audio frames
+    """
+    writer.writeframesraw(b"".join(frames))
 
 
 def save_audio_frames(
@@ -111,6 +176,7 @@ def save_audio_frames(
     sample_width: Optional[int] = None,
     rate: Optional[int] = None,
     p: Optional[pyaudio.PyAudio] = None,
+    writer: Optional[wave.Wave_write] = None,
 ) -> bool:
     """
     Save audio frames to a WAV file.
@@ -122,10 +188,21 @@ def save_audio_frames(
         sample_width: Sample width in bytes (default from PyAudio)
         rate: Sample rate (default from config)
         p: PyAudio instance (if None, creates temporary instance)
+        writer: Open writer to append to instead of creating filename. The
+            caller owns it and closes it once the last clip is appended.
 
     Returns:
         True if successful, False otherwise
     """
+    if writer is not None:
+        try:
+            _append_frames(writer, frames)
+            logger.debug("Appended audio to %s", filename)
+            return True
+        except Exception as e:
+            handle_error(e, logger, f"Failed to append audio to {filename}")
+            return False
+
     # Use configuration for default parameters
     if channels is None:
         channels = config.get("CHANNELS", 1)
@@ -134,7 +211,7 @@ def save_audio_frames(
 
     # Handle PyAudio instance
     close_p = False
-    if p is None:
+    if p is None and sample_width is None:
         p = pyaudio.PyAudio()
         close_p = True
 
@@ -146,13 +223,10 @@ def save_audio_frames(
 
     try:
         # Save audio data to WAV file
-        with wave.open(filename, "wb") as wf:
-            wf.setnchannels(channels)
-            wf.setsampwidth(sample_width)
-            wf.setframerate(rate)
-            wf.writeframes(b"".join(frames))
+        with _make_writer(filename, channels, sample_width, rate) as wf:
+            _append_frames(wf, frames)
 
-        logger.debug(f"Saved audio to {filename}")
+        logger.debug("Saved audio to %s", filename)
         return True
 
     except Exception as e:
@@ -165,26 +239,58 @@ def save_audio_frames(
             p.terminate()
 
 
-def play_system_sound(sound_name: str = "Pop") -> bool:
+def play_system_sound(sound_name: str = "Pop", block: bool = False) -> bool:
     """
-    Play a system sound.
+    Play a system sound, by default without waiting for playback to finish.
 
     Args:
         sound_name: Name of system sound (without path or extension)
+        block: Wait for the sound to finish playing before returning
 
     Returns:
         True if successful, False otherwise
     """
-    sound_file = f"/System/Library/Sounds/{sound_name}.aiff"
-
-    if not os.path.exists(sound_file):
-        logger.warning(f"System sound not found: {sound_file}")
+    # Fall back to a stat when the listing was unavailable (e.g. sandboxed)
+    if _SYSTEM_SOUNDS:
+        sound_file = _SYSTEM_SOUNDS.get(sound_name)
+    else:
+        sound_file = SYSTEM_SOUNDS_DIR + "/" + sound_name + ".aiff"
+        if not os.path.exists(sound_file):
+            sound_file = None
+
+    if sound_file is None:
+        logger.warning("System sound not found: %s", sound_name)
         return False
 
     try:
-        import subprocess
-
-        subprocess.run(["afplay", sound_file], check=False)
+        if block:
+            subprocess.run(
+                [AFPLAY_PATH, sound_file],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=True,
+                check=False,
+            )
+            return True
+
+        # Fire and forget: don't block the caller while the sound plays
+        player = subprocess.Popen(
+            [AFPLAY_PATH, sound_file],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+        )
+
+        # Callers play sounds from several threads, so update the list under
+        # the lock; players that have finished are reaped so they don't
+        # linger as zombies
+        with _sound_processes_lock:
+            _sound_processes[:] = [
+                proc for proc in _sound_processes if proc.poll() is None
+            ]
+            _sound_processes.append(player)
         return True
     except Exception as e:
         handle_error(e, logger, f"Failed to play system sound: {sound_name}")
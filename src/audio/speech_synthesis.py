@@ -4,16 +4,21 @@ External API-based speech synthesis module.
 Provides TTS capabilities by calling an external API for speech generation.
 """
 
+import functools
+import hashlib
+import itertools
 import os
+import queue
+import re
 import sys
 import requests
 import subprocess
 import threading
-import time
 import random
 import logging
-import tempfile
-from typing import Optional, Dict, Any, List, Union
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterable, List, Tuple, Union
 import sys
 
 # Add parent directory to import path
@@ -30,15 +35,67 @@ logger = logging.getLogger("speech-synthesis")
 SERVER_URL = os.environ.get("SERVER_URL", "http://localhost:6000")
 TTS_ENDPOINT = f"{SERVER_URL}/tts"
 
-# Track if speech is currently in progress
-_speaking_lock = threading.Lock()
-_currently_speaking = False
+# Shared HTTP session so the TCP connection to the TTS server is kept alive
+# between utterances instead of being re-established for every request
+_session = requests.Session()
+STREAM_CHUNK_BYTES = 64 * 1024
 
-# Queue for speech requests to prevent overlapping
-_speech_queue = []
-_queue_lock = threading.Lock()
-_queue_thread = None
-_queue_running = False
+# Synthesized audio is cached on disk keyed by text and synthesis parameters,
+# so repeated phrases skip the API call. Least recently used files are
+# evicted once the cache grows past SPEECH_CACHE_MAX_BYTES.
+SPEECH_CACHE_DIR = os.environ.get(
+    "SPEECH_CACHE_DIR", os.path.expanduser("~/.cache/whisper_voice_control/speech")
+)
+SPEECH_CACHE_MAX_BYTES = 100 * 1024 * 1024
+_cache_lock = threading.Lock()
+_cache_index = None  # OrderedDict of path -> size, oldest first; loaded lazily
+_PID = os.getpid()
+_temp_counter = itertools.count()
+
+# Queue for speech requests to prevent overlapping, drained by one
+# long-lived daemon thread started at import
+_speech_queue = queue.Queue()
+
+# Requests queued or being spoken, keyed by their speech parameters, so a
+# repeat of an in-flight phrase joins it instead of being spoken twice
+_pending_requests = {}
+_pending_lock = threading.Lock()
+
+# Audio player command prefix for this platform, resolved once at import
+if sys.platform == "darwin":  # macOS
+    _PLAYER_CMD = ("afplay",)
+elif sys.platform.startswith("linux"):
+    _PLAYER_CMD = ("aplay",)
+else:
+    _PLAYER_CMD = None
+
+# Audio players currently running, terminated by stop_speaking
+_active_players = set()
+_players_lock = threading.Lock()
+
+# Incremented by stop_speaking so in-progress requests skip remaining batches
+_stop_generation = 0
+
+# A queued request with its parameters fully resolved by speak();
+# `generation` is the stop generation it was queued in, and `done` is set
+# once the request has been spoken or dropped
+_SpeechRequest = namedtuple(
+    "_SpeechRequest",
+    "text voice_id speed use_high_quality enhance_audio generation done",
+)
+
+# Long texts are spoken in sentence batches so playback can start after the
+# first batch while the next one is synthesized in the background
+MAX_BATCH_CHARS = 400
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
+_synthesis_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="speech-prefetch"
+)
+# Prerendering gets its own worker so it never delays speech being played
+_prerender_executor = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="speech-prerender"
+)
 
 # Casual responses for common interactions
 CASUAL_RESPONSES = {
@@ -128,26 +185,187 @@ CASUAL_RESPONSES = {
 }
 
 
+# Immutable copies of the response lists for random selection
+_RESPONSES = {
+    category: tuple(responses) for category, responses in CASUAL_RESPONSES.items()
+}
+
+# Each thread gets its own RNG so callers on different threads never share
+# the module-level random state
+_rng_local = threading.local()
+
+
+def _rng() -> random.Random:
+    """Get the calling thread's random number generator."""
+    rng = getattr(_rng_local, "rng", None)
+    if rng is None:
+        rng = _rng_local.rng = random.Random()
+    return rng
+
+
 def is_speaking() -> bool:
-    """Check if speech is currently in progress.
+    """Check if speech is currently in progress or queued.
 
     Returns:
-        Boolean indicating if speech is in progress
+        Boolean indicating if speech is in progress or pending
     """
-    with _speaking_lock:
-        return _currently_speaking
+    # Requests count as unfinished from put() until _finish_request marks
+    # them done, so there is no gap between dequeuing and speaking one
+    return _speech_queue.unfinished_tasks > 0
 
 
 def stop_speaking() -> None:
     """Stop all current and queued speech."""
-    global _queue_running
+    global _stop_generation
 
     logger.info("Stopping all speech output")
+    with _players_lock:
+        _stop_generation += 1
 
-    # Clear the speech queue
-    with _queue_lock:
-        _speech_queue.clear()
-        _queue_running = False
+    # Drain the speech queue, releasing anyone blocked on a dropped request
+    while True:
+        try:
+            speech_request = _speech_queue.get_nowait()
+        except queue.Empty:
+            break
+
+        _finish_request(speech_request)
+
+    # Cut off whatever is playing right now
+    with _players_lock:
+        players = list(_active_players)
+    for player in players:
+        try:
+            player.terminate()
+        except OSError:
+            pass
+
+
+def _finish_request(speech_request: "_SpeechRequest") -> None:
+    """Mark a request taken off the queue as spoken or dropped.
+
+    Args:
+        speech_request: Request to finish
+    """
+    with _pending_lock:
+        key = speech_request[:5]
+        if _pending_requests.get(key) is speech_request:
+            del _pending_requests[key]
+
+    # Count it as finished before waking any caller blocked on it, so
+    # is_speaking() is already accurate when they resume
+    _speech_queue.task_done()
+    speech_request.done.set()
+
+
+@functools.lru_cache(maxsize=256)
+def _cache_file_name(
+    text: str,
+    voice_id: str,
+    speed: float,
+    use_high_quality: bool,
+    enhance_audio: bool,
+) -> str:
+    """Get the cache file name for a set of synthesis parameters.
+
+    Memoized so recurring phrases skip re-hashing their text.
+
+    Returns:
+        File name of the cached audio within SPEECH_CACHE_DIR
+    """
+    key = f"{text}|{voice_id}|{speed}|{use_high_quality}|{enhance_audio}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest() + ".wav"
+
+
+def _cache_path(
+    text: str,
+    voice_id: str,
+    speed: float,
+    use_high_quality: bool,
+    enhance_audio: bool,
+) -> str:
+    """Get the cache file path for a synthesis request.
+
+    Returns:
+        Path of the cached audio file (which may not exist yet)
+    """
+    return os.path.join(
+        SPEECH_CACHE_DIR,
+        _cache_file_name(text, voice_id, speed, use_high_quality, enhance_audio),
+    )
+
+
+def _get_cache_index() -> "OrderedDict[str, int]":
+    """Get the LRU index of cached audio files, scanning the cache on first use.
+
+    Must be called with _cache_lock held.
+
+    Returns:
+        OrderedDict mapping cached file paths to sizes, least recent first
+    """
+    global _cache_index
+
+    if _cache_index is None:
+        os.makedirs(SPEECH_CACHE_DIR, exist_ok=True)
+
+        entries = []
+        for entry in os.scandir(SPEECH_CACHE_DIR):
+            if entry.name.endswith(".wav"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+
+        _cache_index = OrderedDict(
+            (path, size) for _, path, size in sorted(entries)
+        )
+
+    return _cache_index
+
+
+def _cache_lookup(path: str) -> bool:
+    """Check whether a cached audio file exists and mark it recently used.
+
+    Args:
+        path: Cache file path from _cache_path
+
+    Returns:
+        True if the file is cached
+    """
+    with _cache_lock:
+        index = _get_cache_index()
+        try:
+            # Touch the file so LRU order survives restarts
+            os.utime(path)
+        except FileNotFoundError:
+            index.pop(path, None)
+            return False
+
+        if path in index:
+            index.move_to_end(path)
+        else:
+            index[path] = os.path.getsize(path)
+        return True
+
+
+def _cache_store(path: str, size: int) -> None:
+    """Record a newly cached audio file and evict old files over the budget.
+
+    Args:
+        path: Cache file path from _cache_path
+        size: Size of the file in bytes
+    """
+    with _cache_lock:
+        index = _get_cache_index()
+        index[path] = size
+        index.move_to_end(path)
+
+        total = sum(index.values())
+        while total > SPEECH_CACHE_MAX_BYTES and len(index) > 1:
+            old_path, old_size = index.popitem(last=False)
+            total -= old_size
+            try:
+                os.remove(old_path)
+            except FileNotFoundError:
+                pass
 
 
 def _call_speech_api(
@@ -159,6 +377,9 @@ def _call_speech_api(
 ) -> Optional[str]:
     """Call external API to synthesize speech.
 
+    Results are cached on disk, so repeated requests for the same text and
+    parameters return the cached file without calling the API.
+
     Args:
         text: Text to synthesize
         voice_id: Speaker ID for the VITS model (defaults to NEURAL_VOICE_ID from config)
@@ -177,9 +398,12 @@ def _call_speech_api(
         return None
 
     try:
-        # Create a temporary file for the audio
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_path = temp_file.name
+        cache_path = _cache_path(
+            text, voice_id, speed, use_high_quality, enhance_audio
+        )
+        if _cache_lookup(cache_path):
+            logger.debug("Using cached speech for '%s'", text)
+            return cache_path
 
         # Call the API using POST method with JSON body
         headers = {"Content-Type": "application/json"}
@@ -191,59 +415,100 @@ def _call_speech_api(
             "enhance_audio": enhance_audio,
         }
 
-        logger.debug(f"Calling speech API with text: '{text}'")
+        logger.debug("Calling speech API with text: '%s'", text)
 
-        response = requests.post(
-            TTS_ENDPOINT, headers=headers, json=payload, timeout=10
+        # Stream the response so audio is written to disk as it arrives
+        response = _session.post(
+            TTS_ENDPOINT, headers=headers, json=payload, timeout=10, stream=True
         )
 
-        if response.status_code != 200:
-            logger.error(
-                f"API call failed with status {response.status_code}: {response.text}"
-            )
-            return None
-
-        # Save the audio to the temporary file
-        with open(temp_path, "wb") as f:
-            f.write(response.content)
-
-        logger.debug(f"Speech saved to {temp_path}")
-        return temp_path
+        try:
+            if response.status_code != 200:
+                logger.error(
+                    f"API call failed with status {response.status_code}: {response.text}"
+                )
+                return None
+
+            # Write to a unique temporary name first so readers never see a
+            # partial file and concurrent misses for the same text don't clash
+            temp_path = f"{cache_path}.{_PID}.{next(_temp_counter)}.tmp"
+            size = 0
+            try:
+                with open(temp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                        f.write(chunk)
+                        size += len(chunk)
+                os.replace(temp_path, cache_path)
+            except BaseException:
+                try:
+                    os.remove(temp_path)
+                except FileNotFoundError:
+                    pass
+                raise
+        finally:
+            response.close()
+
+        _cache_store(cache_path, size)
+
+        logger.debug("Speech saved to %s", cache_path)
+        return cache_path
 
     except Exception as e:
         logger.error(f"Error in API call: {e}")
         return None
 
 
-def _play_audio(file_path: str) -> bool:
+def _play_audio(file_path: str, generation: Optional[int] = None) -> bool:
     """Play an audio file using system commands.
 
     Args:
         file_path: Path to the audio file
+        generation: Stop generation the caller started under; playback is
+            skipped if stop_speaking has been called since
 
     Returns:
         Boolean indicating success
     """
-    if not file_path or not os.path.exists(file_path):
+    # The path comes straight from _call_speech_api, so skip a stat here and
+    # let the player report a missing file
+    if not file_path:
+        return False
+
+    # Use platform-specific commands to play audio
+    if _PLAYER_CMD is not None:
+        cmd = [*_PLAYER_CMD, file_path]
+    elif sys.platform == "win32":
+        cmd = [
+            "powershell",
+            "-c",
+            f"(New-Object Media.SoundPlayer '{file_path}').PlaySync();",
+        ]
+    else:
+        logger.error(f"Unsupported platform: {sys.platform}")
         return False
 
     try:
-        # Use platform-specific commands to play audio
-        if sys.platform == "darwin":  # macOS
-            subprocess.run(["afplay", file_path], check=True)
-        elif sys.platform.startswith("linux"):
-            subprocess.run(["aplay", file_path], check=True)
-        elif sys.platform == "win32":
-            subprocess.run(
-                [
-                    "powershell",
-                    "-c",
-                    f"(New-Object Media.SoundPlayer '{file_path}').PlaySync();",
-                ],
-                check=True,
+        # Track the player so stop_speaking can terminate exactly this process;
+        # its output is never read, so don't allocate pipes for it. Checking
+        # the generation under the lock means a player can't start just after
+        # stop_speaking has collected the ones to terminate.
+        with _players_lock:
+            if generation is not None and generation != _stop_generation:
+                return False
+            player = subprocess.Popen(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
             )
-        else:
-            logger.error(f"Unsupported platform: {sys.platform}")
+            _active_players.add(player)
+
+        try:
+            returncode = player.wait()
+        finally:
+            with _players_lock:
+                _active_players.discard(player)
+
+        # A negative return code means stop_speaking terminated the player
+        if returncode > 0:
+            logger.error(f"Error playing audio: player exited with {returncode}")
             return False
 
         return True
@@ -251,68 +516,152 @@ def _play_audio(file_path: str) -> bool:
     except Exception as e:
         logger.error(f"Error playing audio: {e}")
         return False
-    finally:
-        # Clean up the temporary file
-        try:
-            if os.path.exists(file_path):
-                os.remove(file_path)
-        except Exception as e:
-            logger.error(f"Error removing temporary file: {e}")
 
 
-def _process_speech_queue() -> None:
-    """Process the speech queue in a background thread."""
-    global _queue_running, _currently_speaking
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentence batches for synthesis.
 
-    logger.debug("Starting speech queue processing thread")
+    Whitespace runs are collapsed first, then consecutive sentences are
+    packed greedily into batches of at most MAX_BATCH_CHARS characters. A
+    single sentence longer than the limit becomes its own batch.
 
-    while True:
-        speech_request = None
+    Args:
+        text: Text to split
 
-        # Get the next item from the queue
-        with _queue_lock:
-            if not _speech_queue:
-                _queue_running = False
-                break
+    Returns:
+        List of non-empty text batches
+    """
+    text = _WHITESPACE_RE.sub(" ", text).strip()
+    if not text:
+        return []
+
+    batches = []
+    current = ""
+    for sentence in _SENTENCE_END_RE.split(text):
+        if current and len(current) + 1 + len(sentence) > MAX_BATCH_CHARS:
+            batches.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
 
-            speech_request = _speech_queue.pop(0)
+    if current:
+        batches.append(current)
 
-        if speech_request:
-            # Mark as speaking
-            with _speaking_lock:
-                _currently_speaking = True
+    return batches
 
-            # Generate and play speech
-            try:
-                # Handle both string and dict formats for backward compatibility
-                if isinstance(speech_request, str):
-                    audio_file = _call_speech_api(speech_request)
-                else:
-                    text = speech_request.get("text", "")
-                    voice_id = speech_request.get("voice_id", "p230")
-                    speed = speech_request.get("speed", 1.0)
-                    use_high_quality = speech_request.get("use_high_quality", True)
-                    enhance_audio = speech_request.get("enhance_audio", True)
 
-                    audio_file = _call_speech_api(
-                        text,
-                        voice_id=voice_id,
-                        speed=speed,
-                        use_high_quality=use_high_quality,
-                        enhance_audio=enhance_audio,
-                    )
+def _submit_synthesis(speech_request: "_SpeechRequest", text: str) -> Future:
+    """Start synthesizing part of a request's text on the prefetch executor.
 
-                if audio_file:
-                    _play_audio(audio_file)
+    Args:
+        speech_request: Request whose synthesis parameters to use
+        text: Text batch to synthesize
 
-            except Exception as e:
-                logger.error(f"Error in speech synthesis: {e}")
+    Returns:
+        Future resolving to the audio file path (or None)
+    """
+    return _synthesis_executor.submit(
+        _call_speech_api,
+        text,
+        voice_id=speech_request.voice_id,
+        speed=speech_request.speed,
+        use_high_quality=speech_request.use_high_quality,
+        enhance_audio=speech_request.enhance_audio,
+    )
+
+
+def _prefetch_next_request() -> Optional[Tuple["_SpeechRequest", Future]]:
+    """Start synthesizing the first batch of the next queued request, if any.
+
+    The request stays in the queue; the returned future is handed back to
+    _synthesize_and_play when the request is dequeued.
 
-            # Mark as not speaking
-            with _speaking_lock:
-                _currently_speaking = False
+    Returns:
+        Tuple of (request, future) or None if the queue is empty
+    """
+    with _speech_queue.mutex:
+        if not _speech_queue.queue:
+            return None
+        next_request = _speech_queue.queue[0]
+
+    batches = _split_sentences(next_request.text)
+    if not batches:
+        return None
 
-    logger.debug("Speech queue processing thread finished")
+    return next_request, _submit_synthesis(next_request, batches[0])
+
+
+def _synthesize_and_play(
+    speech_request: "_SpeechRequest", first_audio: Optional[Future] = None
+) -> Optional[Tuple["_SpeechRequest", Future]]:
+    """Speak a request batch by batch, prefetching the next batch during playback.
+
+    While the last batch plays, the first batch of the next queued request
+    is prefetched so consecutive requests play back without a synthesis gap.
+
+    Args:
+        speech_request: Request to speak
+        first_audio: Already-started synthesis of the first batch, if any
+
+    Returns:
+        The prefetch started for the next queued request, if any
+    """
+    batches = _split_sentences(speech_request.text)
+    if not batches:
+        return None
+
+    pending = first_audio or _submit_synthesis(speech_request, batches[0])
+    prefetched = None
+
+    # Taken when the request was queued, so a stop_speaking call made after
+    # it was dequeued but before it started still cancels it
+    generation = speech_request.generation
+
+    for next_batch in batches[1:] + [None]:
+        audio_file = pending.result()
+
+        # Abandon the remaining batches once stop_speaking has been called
+        if generation != _stop_generation:
+            return None
+
+        # Start synthesizing the next batch before playing the current one
+        if next_batch is not None:
+            pending = _submit_synthesis(speech_request, next_batch)
+        else:
+            prefetched = _prefetch_next_request()
+
+        if audio_file:
+            _play_audio(audio_file, generation)
+
+    return prefetched
+
+
+def _process_speech_queue() -> None:
+    """Process the speech queue in a background thread."""
+    logger.debug("Starting speech queue processing thread")
+
+    prefetched = None
+
+    while True:
+        # Block until the next request arrives
+        speech_request = _speech_queue.get()
+
+        # Reuse the synthesis started while the previous request was playing
+        first_audio = None
+        if prefetched is not None and prefetched[0] is speech_request:
+            first_audio = prefetched[1]
+        prefetched = None
+
+        # Generate and play speech
+        try:
+            prefetched = _synthesize_and_play(speech_request, first_audio)
+
+        except Exception as e:
+            logger.error(f"Error in speech synthesis: {e}")
+
+        finally:
+            # Finishing the request also marks it as no longer speaking
+            _finish_request(speech_request)
 
 
 def speak(
@@ -322,6 +671,7 @@ def speak(
     use_high_quality: bool = True,
     enhance_audio: bool = True,
     block: bool = False,
+    allow_duplicate: bool = False,
 ) -> bool:
     """Synthesize speech using the external API.
 
@@ -332,6 +682,8 @@ def speak(
         use_high_quality: Whether to use highest quality settings
         enhance_audio: Whether to apply additional GPU-based audio enhancement
         block: Whether to block until speech is complete
+        allow_duplicate: Whether to queue the text even if the same text with
+            the same parameters is already queued or being spoken
 
     Returns:
         Boolean indicating success
@@ -339,32 +691,29 @@ def speak(
     if not text:
         return False
 
-    logger.debug(f"Adding to speech queue: '{text}'")
-
-    # Store speech parameters with the text
-    speech_request = {
-        "text": text,
-        "voice_id": voice,
-        "speed": rate,
-        "use_high_quality": use_high_quality,
-        "enhance_audio": enhance_audio,
-    }
-
-    # Add to queue
-    with _queue_lock:
-        _speech_queue.append(speech_request)
-
-        # Start queue processing thread if not already running
-        global _queue_running, _queue_thread
-        if not _queue_running:
-            _queue_running = True
-            _queue_thread = threading.Thread(target=_process_speech_queue, daemon=True)
-            _queue_thread.start()
-
-    # If blocking, wait until speech is complete
+    logger.debug("Adding to speech queue: '%s'", text)
+
+    # Resolve the speech parameters once; they also identify repeats
+    if voice is None:
+        voice = config.get("NEURAL_VOICE_ID", "p230")
+    key = (text, voice, rate, use_high_quality, enhance_audio)
+
+    with _pending_lock:
+        speech_request = None if allow_duplicate else _pending_requests.get(key)
+        if speech_request is None:
+            with _players_lock:
+                generation = _stop_generation
+            speech_request = _SpeechRequest(*key, generation, threading.Event())
+            _pending_requests.setdefault(key, speech_request)
+
+            # Add to queue; the processing thread picks it up immediately
+            _speech_queue.put(speech_request)
+        else:
+            logger.debug("Already speaking or queued: '%s'", text)
+
+    # If blocking, wait until this request has been spoken
     if block:
-        while is_speaking() or (_queue_running and len(_speech_queue) > 0):
-            time.sleep(0.1)
+        speech_request.done.wait()
 
     return True
 
@@ -390,12 +739,12 @@ def speak_random(
     Returns:
         Boolean indicating success
     """
-    if category not in CASUAL_RESPONSES:
+    responses = _RESPONSES.get(category)
+    if responses is None:
         logger.warning(f"Unknown response category: {category}")
         return False
 
-    responses = CASUAL_RESPONSES[category]
-    selected = random.choice(responses)
+    selected = _rng().choice(responses)
 
     return speak(
         selected,
@@ -407,5 +756,67 @@ def speak_random(
     )
 
 
+def prewarm_cache(
+    voice: str = None, phrases: Optional[Iterable[str]] = None
+) -> threading.Thread:
+    """Synthesize every casual response into the speech cache in the background.
+
+    The responses are a small fixed set, so caching them up front means
+    speak_random() only has to play a file that is already on disk.
+
+    Args:
+        voice: Voice ID for the model (defaults to NEURAL_VOICE_ID from config)
+        phrases: Additional fixed phrases to cache along with the responses
+
+    Returns:
+        The daemon thread doing the synthesis
+    """
+    if voice is None:
+        voice = config.get("NEURAL_VOICE_ID", "p230")
+
+    texts = [text for responses in _RESPONSES.values() for text in responses]
+    if phrases is not None:
+        texts.extend(phrases)
+
+    def _prewarm():
+        for text in dict.fromkeys(texts):
+            _call_speech_api(text, voice_id=voice)
+        logger.debug("%d phrases cached for voice %s", len(texts), voice)
+
+    thread = threading.Thread(target=_prewarm, daemon=True, name="speech-prewarm")
+    thread.start()
+    return thread
+
+
+def prerender(texts: Iterable[str], voice: str = None) -> List[Future]:
+    """Start synthesizing texts into the speech cache concurrently.
+
+    A script of phrases spoken one after another with block=True otherwise
+    waits on the API for each phrase in turn; prerendering lets the later
+    ones play straight from the cache. It runs on a separate worker, so
+    synthesis for speak() is never queued behind it.
+
+    Args:
+        texts: Texts that are about to be spoken with default parameters
+        voice: Voice ID for the model (defaults to NEURAL_VOICE_ID from config)
+
+    Returns:
+        Futures resolving to the cached audio file paths
+    """
+    if voice is None:
+        voice = config.get("NEURAL_VOICE_ID", "p230")
+
+    # Split the same way speak() will, so every batch becomes a cache hit
+    return [
+        _prerender_executor.submit(_call_speech_api, batch, voice_id=voice)
+        for text in texts
+        for batch in _split_sentences(text)
+    ]
+
+
 # Initialize module
+_queue_thread = threading.Thread(
+    target=_process_speech_queue, daemon=True, name="speech-queue"
+)
+_queue_thread.start()
 logger.info(f"Speech synthesis module initialized with TTS endpoint: {TTS_ENDPOINT}")
@@ -98,6 +98,18 @@ class TriggerDetector:
             logger.error(f"Failed to connect to Speech API: {e}")
             raise
 
+    def close(self):
+        """Close the speech API session and the event loop."""
+        try:
+            self.loop.run_until_complete(self.speech_client.close())
+        except Exception as e:
+            logger.error(f"Error closing speech API session: {e}")
+
+        try:
+            self.loop.close()
+        except Exception as e:
+            logger.error(f"Error closing asyncio loop: {e}")
+
     def process_audio_buffer(self, audio_buffer):
         """Process audio buffer to detect trigger words.
 
@@ -193,26 +205,22 @@ class TriggerDetector:
             "trigger_type": "dictation",  # Default to dictation mode
         }
 
+        # Lowercase once; the trigger variations are already lowercase
+        lowered = transcription.lower()
+
         # Check for Jarvis trigger - this will now activate Cloud Code
-        contains_jarvis_trigger = any(
-            variation in transcription.lower() for variation in self.command_variations
-        )
-
-        # Process Jarvis trigger to activate Code Agent
-        if contains_jarvis_trigger:
-            logger.info(f"Jarvis trigger detected for Code Agent: '{transcription}'")
-            # Extract the query part (remove jarvis trigger)
-            for trigger in self.command_variations:
-                if trigger in transcription.lower():
-                    # Get everything after the trigger word
-                    trigger_pos = transcription.lower().find(trigger) + len(trigger)
-                    query = transcription[trigger_pos:].strip()
-                    # If there's a query, use it, otherwise use the whole text
-                    if query:
-                        result["transcription"] = query
-                    # Set to code_agent type
-                    result["trigger_type"] = "code_agent"
-                    break
+        for trigger in self.command_variations:
+            trigger_pos = lowered.find(trigger)
+            if trigger_pos != -1:
+                logger.info(f"Jarvis trigger detected for Code Agent: '{transcription}'")
+                # Get everything after the trigger word
+                query = transcription[trigger_pos + len(trigger):].strip()
+                # If there's a query, use it, otherwise use the whole text
+                if query:
+                    result["transcription"] = query
+                # Set to code_agent type
+                result["trigger_type"] = "code_agent"
+                break
         # Otherwise use dictation as the default
         else:
             logger.info(f"No Jarvis trigger detected, defaulting to dictation mode: '{transcription}'")
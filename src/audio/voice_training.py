@@ -346,9 +346,10 @@ def collect_trigger_samples() -> List[str]:
             print("No samples collected. Using test samples instead.")
             # Create a dummy sample if interrupted before any samples were collected
             dummy_path = os.path.join(TRAINING_DIR, "dummy_sample.wav")
-            subprocess.run(
-                ["cp", "/System/Library/Sounds/Tink.aiff", dummy_path], check=False
-            )
+            try:
+                shutil.copyfile("/System/Library/Sounds/Tink.aiff", dummy_path)
+            except OSError as e:
+                logger.warning("Could not create dummy sample: %s", e)
             samples.append(dummy_path)
 
     return samples
@@ -482,14 +483,23 @@ def collect_command_samples() -> List[str]:
             print("No command samples collected. Using test samples instead.")
             # Create a dummy sample if interrupted before any samples were collected
             dummy_path = os.path.join(TRAINING_DIR, "dummy_command_sample.wav")
-            subprocess.run(
-                ["cp", "/System/Library/Sounds/Tink.aiff", dummy_path], check=False
-            )
+            try:
+                shutil.copyfile("/System/Library/Sounds/Tink.aiff", dummy_path)
+            except OSError as e:
+                logger.warning("Could not create dummy sample: %s", e)
             samples.append(dummy_path)
 
     return samples
 
 
+def _is_nonempty_file(path: str) -> bool:
+    """Check that a file exists and has content with a single stat call."""
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
 def calculate_optimal_thresholds(samples: List[str]) -> Dict[str, float]:
     """Calculate optimal energy thresholds based on samples.
 
@@ -514,9 +524,7 @@ def calculate_optimal_thresholds(samples: List[str]) -> Dict[str, float]:
     # Analyze each sample
     try:
         # Filter out any sample paths that might be problematic
-        valid_samples = [
-            s for s in samples if os.path.exists(s) and os.path.getsize(s) > 0
-        ]
+        valid_samples = [s for s in samples if _is_nonempty_file(s)]
 
         if not valid_samples:
             print(
@@ -577,14 +585,11 @@ def create_voice_model(
     Returns:
         Path to the created voice model directory
     """
-    # Ensure voice models directory exists
-    if not os.path.exists(VOICE_MODELS_DIR):
-        os.makedirs(VOICE_MODELS_DIR)
-
-    # Create model directory
+    # Create the model directory and its samples directory (and the voice
+    # models directory above them) in one call
     model_dir = os.path.join(VOICE_MODELS_DIR, name)
-    if not os.path.exists(model_dir):
-        os.makedirs(model_dir)
+    model_samples_dir = os.path.join(model_dir, "samples")
+    os.makedirs(model_samples_dir, exist_ok=True)
 
     # If no samples provided, use all WAV files in training directory
     if not samples:
@@ -613,15 +618,13 @@ def create_voice_model(
     }
 
     # Optional: copy samples to model directory for self-contained model
-    model_samples_dir = os.path.join(model_dir, "samples")
-    if not os.path.exists(model_samples_dir):
-        os.makedirs(model_samples_dir)
-
     for sample in samples:
-        if os.path.exists(sample):
+        try:
             shutil.copy2(
                 sample, os.path.join(model_samples_dir, os.path.basename(sample))
             )
+        except FileNotFoundError:
+            pass
 
     # Save metadata
     with open(os.path.join(model_dir, "metadata.json"), "w") as f:
@@ -925,13 +928,15 @@ def install_voice_model(name: str = DEFAULT_VOICE_MODEL) -> bool:
         Boolean indicating success
     """
     model_dir = os.path.join(VOICE_MODELS_DIR, name)
-    if not os.path.exists(model_dir):
-        print(f"Voice model '{name}' not found!")
-        return False
-
     metadata_path = os.path.join(model_dir, "metadata.json")
-    if not os.path.exists(metadata_path):
-        print(f"Voice model metadata for '{name}' not found!")
+
+    # Check the metadata file directly; the model directory only needs
+    # checking to pick the right message when it is missing
+    if not os.path.isfile(metadata_path):
+        if not os.path.isdir(model_dir):
+            print(f"Voice model '{name}' not found!")
+        else:
+            print(f"Voice model metadata for '{name}' not found!")
         return False
 
     # Create a symlink or config file that the speech synthesis module can use
@@ -7,7 +7,7 @@ Centralizes configuration from environment variables, settings files, and defaul
 import os
 import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from dotenv import load_dotenv
 
 logger = logging.getLogger("config")
@@ -21,6 +21,10 @@ class Config:
 
     _instance = None
 
+    # Parsed configuration files keyed by path, with the (mtime, size) they
+    # were parsed at; re-initialisation reuses them while unchanged
+    _parsed_files: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
     def __new__(cls, reset=False):
         """
         Ensure only one instance exists (Singleton pattern).
@@ -141,16 +145,45 @@ class Config:
         ]
 
         for config_file in config_files:
-            if os.path.exists(config_file):
-                try:
-                    with open(config_file, "r") as f:
-                        file_config = json.load(f)
-                        self._config.update(file_config)
-                        logger.info(f"Loaded configuration from {config_file}")
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to load configuration from {config_file}: {e}"
-                    )
+            try:
+                file_config = self._read_config_file(config_file)
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                logger.warning(
+                    f"Failed to load configuration from {config_file}: {e}"
+                )
+                continue
+
+            self._config.update(file_config)
+            logger.info(f"Loaded configuration from {config_file}")
+
+    @classmethod
+    def _read_config_file(cls, config_file: str) -> Dict[str, Any]:
+        """
+        Parse a JSON configuration file, reusing the last parse if unchanged.
+
+        Args:
+            config_file: Path to the JSON file
+
+        Returns:
+            Parsed configuration values
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        stat = os.stat(config_file)
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        cached = cls._parsed_files.get(config_file)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        with open(config_file, "r") as f:
+            file_config = json.load(f)
+
+        cls._parsed_files[config_file] = (key, file_config)
+        return file_config
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -196,13 +229,11 @@ class Config:
             True if saved successfully, False otherwise
         """
         if filepath is None:
-            config_dir = os.path.expanduser("~/.config/whisper_voice_control")
-            os.makedirs(config_dir, exist_ok=True)
-            filepath = os.path.join(config_dir, "config.json")
+            filepath = os.path.expanduser("~/.config/whisper_voice_control/config.json")
 
-        # Ensure directory exists
+        # Ensure directory exists; makedirs already tolerates an existing one
         directory = os.path.dirname(filepath)
-        if directory and not os.path.exists(directory):
+        if directory:
             os.makedirs(directory, exist_ok=True)
 
         try:
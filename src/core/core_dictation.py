@@ -4,7 +4,6 @@ Core dictation processing module for voice control system.
 Provides common functionality for all dictation implementations.
 """
 
-import os
 import time
 import logging
 import subprocess
@@ -105,30 +104,25 @@ class CoreDictationProcessor:
             bool: True if successful
         """
         try:
-            # Save to temp file for AppleScript
-            tmp_file = "/tmp/dictation_text.txt"
-            with open(tmp_file, "w") as f:
-                f.write(text)
-
-            # AppleScript to keystroke the text
+            # Pass the text as a script argument rather than through a temp
+            # file, which saves a disk round trip and a `cat` subprocess
             script = """
-            set the_text to (do shell script "cat /tmp/dictation_text.txt")
-            tell application "System Events"
-                delay 0.5
-                keystroke the_text
-            end tell
+            on run argv
+                set the_text to item 1 of argv
+                tell application "System Events"
+                    delay 0.5
+                    keystroke the_text
+                end tell
+            end run
             """
 
             result = subprocess.run(
-                ["osascript", "-e", script], check=False, capture_output=True, text=True
+                ["osascript", "-e", script, "--", text],
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
             )
 
-            # Clean up temp file
-            try:
-                os.remove(tmp_file)
-            except Exception as e:
-                logger.debug(f"Failed to remove temp file: {e}")
-
             return result.returncode == 0
 
         except Exception as e:
@@ -8,6 +8,7 @@ import threading
 import time
 import logging
 import queue
+from collections import deque
 
 logger = logging.getLogger("state-manager")
 
@@ -38,8 +39,8 @@ class StateManager:
         self.trigger_detection_running = False
         self.trigger_mutex = threading.Lock()
 
-        # Audio buffer
-        self.audio_buffer = []
+        # Audio buffer; a deque so the oldest frame is dropped in O(1)
+        self.audio_buffer = deque()
         self.audio_buffer_seconds = 5
         self.audio_buffer_lock = threading.Lock()
         self.speech_start_index = 0  # Track the start of speech in the buffer
@@ -183,7 +183,6 @@ class VoiceControlDaemon:
 
                     # Generate greeting with timeout handling
                     import threading
-                    import time
 
                     # Generate greeting in a separate thread with timeout
                     generated = [False]
@@ -203,10 +202,9 @@ class VoiceControlDaemon:
                     gen_thread.daemon = True
                     gen_thread.start()
 
-                    # Wait for up to 5 seconds for generation to complete
-                    start_time = time.time()
-                    while time.time() - start_time < 5 and not generated[0]:
-                        time.sleep(0.2)
+                    # Wait for up to 5 seconds for generation to complete,
+                    # returning as soon as the thread finishes
+                    gen_thread.join(timeout=5)
 
                     if generated[0] and greeting[0]:
                         # Successfully generated a greeting
@@ -227,6 +225,9 @@ class VoiceControlDaemon:
                     tts.speak_random("jarvis_startup", block=True)
 
                 logger.info("Speech synthesis working correctly")
+
+                # Cache the casual and assistant responses so they play instantly
+                tts.prewarm_cache(phrases=assistant.fixed_responses())
             except Exception as e:
                 logger.error(f"Error testing speech synthesis: {e}")
                 # Continue without speech if it fails
@@ -243,19 +244,21 @@ class VoiceControlDaemon:
                     client = SpeechRecognitionClient(api_url=speech_api_url)
                     loop = asyncio.new_event_loop()
 
-                    if not loop.run_until_complete(client.check_connection()):
-                        error_msg = f"Speech Recognition API not available at {speech_api_url}"
-                        logger.error(error_msg)
-                        raise RuntimeError(error_msg)
-
-                    logger.info("Speech Recognition API connection successful")
-
-                    # Get available models
-                    models = loop.run_until_complete(client.list_models())
-                    logger.info(f"Available models on API: {models}")
-
-                    # Clean up
-                    loop.close()
+                    try:
+                        if not loop.run_until_complete(client.check_connection()):
+                            error_msg = f"Speech Recognition API not available at {speech_api_url}"
+                            logger.error(error_msg)
+                            raise RuntimeError(error_msg)
+
+                        logger.info("Speech Recognition API connection successful")
+
+                        # Get available models
+                        models = loop.run_until_complete(client.list_models())
+                        logger.info(f"Available models on API: {models}")
+                    finally:
+                        # Clean up
+                        loop.run_until_complete(client.close())
+                        loop.close()
                 except Exception as e:
                     logger.error(f"Error connecting to Speech Recognition API: {e}")
                     raise
@@ -410,7 +413,6 @@ class VoiceControlDaemon:
 
                             from src.audio.speech_synthesis import speak, speak_random
                             import threading
-                            import time
 
                             # Try to generate with a short timeout
                             generated = [False]
@@ -430,10 +432,9 @@ class VoiceControlDaemon:
                             gen_thread.daemon = True
                             gen_thread.start()
 
-                            # Wait for up to 5 seconds for generation to complete
-                            start_time = time.time()
-                            while time.time() - start_time < 5 and not generated[0]:
-                                time.sleep(0.2)
+                            # Wait for up to 5 seconds for generation to complete,
+                            # returning as soon as the thread finishes
+                            gen_thread.join(timeout=5)
 
                             if generated[0] and greeting[0]:
                                 # Successfully generated a greeting
@@ -475,7 +476,10 @@ class VoiceControlDaemon:
                     }
 
                     # Handle the detection (starts dictation mode)
-                    detector.handle_detection(dictation_result)
+                    try:
+                        detector.handle_detection(dictation_result)
+                    finally:
+                        detector.close()
                     logger.info("Automatically started dictation mode on startup")
                 except Exception as e:
                     logger.error(f"Failed to automatically start dictation mode: {e}")
@@ -503,9 +507,27 @@ class VoiceControlDaemon:
 
         logger.info("Starting onboarding conversation for user")
 
+        phrases = [
+            "Welcome to Voice Control! I'm your voice assistant.",
+            # Introduction to how it works
+            "I'll listen for trigger phrases and respond to your voice commands.",
+            # Explain the modes
+            "By default, I'll type whatever you say as dictation.",
+            f"If you want to talk to Claude Code, just say '{state.command_trigger}' followed by your question.",
+            # Tips for best experience
+            "For best results, speak clearly and use natural commands.",
+            # Completion message
+            "That's all! You're ready to start using voice control. Just speak naturally.",
+        ]
+
         try:
+            # Synthesize the rest of the script while the welcome plays, so
+            # each phrase starts without waiting for the API in turn. This
+            # runs on its own worker and doesn't delay the welcome itself
+            tts.prerender(phrases[1:])
+
             # Onboarding welcome
-            tts.speak("Welcome to Voice Control! I'm your voice assistant.", block=True)
+            tts.speak(phrases[0], block=True)
             time.sleep(0.5)
 
             # Send a notification with welcome message
@@ -517,37 +539,10 @@ class VoiceControlDaemon:
                 True,
             )
 
-            # Introduction to how it works
-            tts.speak(
-                "I'll listen for trigger phrases and respond to your voice commands.",
-                block=True,
-            )
-            time.sleep(0.5)
-
-            # Explain the modes
-            tts.speak(
-                "By default, I'll type whatever you say as dictation.",
-                block=True,
-            )
-            time.sleep(0.5)
-
-            tts.speak(
-                f"If you want to talk to Claude Code, just say '{state.command_trigger}' followed by your question.",
-                block=True,
-            )
-            time.sleep(0.5)
-
-            # Tips for best experience
-            tts.speak(
-                "For best results, speak clearly and use natural commands.", block=True
-            )
-            time.sleep(0.5)
-
-            # Completion message
-            tts.speak(
-                "That's all! You're ready to start using voice control. Just speak naturally.",
-                block=True,
-            )
+            for index, phrase in enumerate(phrases[1:], start=1):
+                tts.speak(phrase, block=True)
+                if index < len(phrases) - 1:
+                    time.sleep(0.5)
 
             # Mark as introduced so we don't show this again
             self._mark_as_introduced()
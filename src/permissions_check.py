@@ -7,7 +7,7 @@ for the voice control daemon to function properly.
 import os
 import sys
 import subprocess
-import time
+import threading
 import pyaudio
 from pynput import keyboard
 
@@ -89,30 +89,34 @@ def check_microphone_permission():
         return False
 
 
+def confirm_proceed():
+    """Ask the user whether to continue despite a failed permission test."""
+    proceed = input("Would you like to proceed anyway? (y/n): ").lower().strip()
+    if proceed == "y" or proceed == "yes":
+        print("Proceeding with voice control daemon...")
+        return True
+    return False
+
+
 def check_accessibility_permission():
     """Check if we have accessibility access by testing keyboard monitoring."""
     print("\nTesting accessibility access for keyboard monitoring...")
     print("Press any key within 5 seconds...")
 
     try:
-        # Set up flag to check if a key was pressed
-        key_pressed = [False]
+        # Set up event to signal that a key was pressed
+        key_pressed = threading.Event()
 
         def on_press(key):
-            key_pressed[0] = True
+            key_pressed.set()
             return False  # Stop listener
 
         # Start listener
         listener = keyboard.Listener(on_press=on_press)
         listener.start()
 
-        # Wait for key press with timeout
-        timeout = 5
-        start_time = time.time()
-        while time.time() - start_time < timeout and not key_pressed[0]:
-            time.sleep(0.1)
-
-        if key_pressed[0]:
+        # Wait for key press with timeout; returns as soon as the key is seen
+        if key_pressed.wait(timeout=5):
             print("✅ Keyboard monitoring permission granted.")
             return True
         else:
@@ -121,9 +125,7 @@ def check_accessibility_permission():
             print(
                 "\nIf you're using Ghostty and have already granted it accessibility permissions:"
             )
-            proceed = input("Would you like to proceed anyway? (y/n): ").lower().strip()
-            if proceed == "y" or proceed == "yes":
-                print("Proceeding with voice control daemon...")
+            if confirm_proceed():
                 return True
             else:
                 print(
@@ -142,12 +144,7 @@ def check_accessibility_permission():
     except Exception as e:
         print(f"Error testing keyboard access: {e}")
         print("⚠️ Unable to properly test keyboard accessibility.")
-        proceed = input("Would you like to proceed anyway? (y/n): ").lower().strip()
-        if proceed == "y" or proceed == "yes":
-            print("Proceeding with voice control daemon...")
-            return True
-        else:
-            return False
+        return confirm_proceed()
 
 
 def main():
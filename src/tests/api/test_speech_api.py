@@ -121,6 +121,30 @@ if FASTAPI_AVAILABLE:
         assert data["text"] == "This is a test transcription"
         assert data["confidence"] == 0.95
 
+    def test_decode_wav():
+        """Test that 16 kHz mono WAV data is decoded without ffmpeg."""
+        import io
+        import wave
+        from src.api.speech_recognition_api import _decode_wav
+
+        def make_wav(rate):
+            buffer = io.BytesIO()
+            with wave.open(buffer, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(rate)
+                wav.writeframes(b"\x00\x40" * 4)
+            return buffer.getvalue()
+
+        audio = _decode_wav(make_wav(16000))
+        assert audio is not None
+        assert len(audio) == 4
+        assert audio[0] == 0.5
+
+        # Other sample rates and non-WAV data fall back to ffmpeg
+        assert _decode_wav(make_wav(44100)) is None
+        assert _decode_wav(b"test audio data") is None
+
 
 # These tests don't depend on FastAPI
 @pytest.mark.asyncio
@@ -17,21 +17,38 @@ import time
 import threading
 import tempfile
 import logging
-import pyaudio
 import sys
 import unittest
+import pytest
 import json
 import re
 import subprocess
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Import common test utilities
-from src.tests.test_utils import BaseVoiceTest, DaemonManager
+from src.tests.test_utils import BaseVoiceTest, DaemonManager, get_pyaudio
+
+# orjson pretty-prints the results much faster than the standard library
+try:
+    import orjson
+
+    def _dump_results(results):
+        return orjson.dumps(results, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _dump_results(results):
+        return json.dumps(results, indent=2).encode()
 
 # Set up logging
 logger = logging.getLogger("dictation-test")
 
+# Fragments of misheard trigger words, matched anywhere in a transcription
+_TRIGGER_FRAGMENT_RE = re.compile(r"typ|dict|tipe|dikt")
 
+
+# The daemon can't hear synthesized speech when CI skips audio playback
+@pytest.mark.ci_skip
 class DictationTest(BaseVoiceTest):
     """Test suite for the dictation functionality (default mode and with optional triggers)."""
 
@@ -45,8 +62,17 @@ class DictationTest(BaseVoiceTest):
             "trigger_detections": [],
             "dictation_transcriptions": [],
             "applescript_executions": [],
+            # test_applescript_execution_verification is skipped
+            "applescript_verification": {
+                "skipped": True,
+                "reason": "Test disabled due to CI reliability issues",
+            },
         }
 
+        # Results record monotonic offsets from here, formatted at teardown
+        cls._start_datetime = datetime.now()
+        cls._start_monotonic = time.monotonic()
+
         # Create test phrase file for verification
         cls.test_phrases_file = os.path.join(cls.log_dir, "test_phrases.txt")
         with open(cls.test_phrases_file, "w") as f:
@@ -55,66 +81,103 @@ class DictationTest(BaseVoiceTest):
             f.write("Testing the dictation functionality\n")
 
         # Initialize speech synthesizer for tests
-        cls.p = pyaudio.PyAudio()
+        cls.p = get_pyaudio()
 
     @classmethod
     def tearDownClass(cls):
         """Clean up after tests."""
         # Save test results
         results_file = os.path.join(cls.log_dir, "test_results.json")
-        with open(results_file, "w") as f:
-            json.dump(cls.test_results, f, indent=2)
+        cls._format_timestamps(cls.test_results)
+        with open(results_file, "wb") as f:
+            f.write(_dump_results(cls.test_results))
 
         logger.info(f"Test results saved to {results_file}")
 
-        # Clean up audio resources
-        cls.p.terminate()
-
         # Call parent teardown
         super().tearDownClass()
 
+    @classmethod
+    def _timestamp(cls):
+        """Get the seconds elapsed since the test class was set up."""
+        return time.monotonic() - cls._start_monotonic
+
+    @classmethod
+    def _format_timestamps(cls, value):
+        """Replace recorded timestamp offsets with ISO format strings.
+
+        Args:
+            value: Result dict or list to update in place
+        """
+        if isinstance(value, list):
+            for item in value:
+                cls._format_timestamps(item)
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                if key == "timestamp" and isinstance(item, float):
+                    value[key] = (
+                        cls._start_datetime + timedelta(seconds=item)
+                    ).isoformat()
+                else:
+                    cls._format_timestamps(item)
+
+    def setUp(self):
+        """Open the dictation log so each test reads only what it adds."""
+        super().setUp()
+
+        # Append mode creates the log if it is missing
+        self._dictation_log_fp = open("dictation_log.txt", "a+")
+        self._dictation_log_fp.seek(0, os.SEEK_END)
+        self._dictation_log_offset = self._dictation_log_fp.tell()
+        self._dictation_log_pending = ""
+
+    def tearDown(self):
+        """Close the dictation log."""
+        self._dictation_log_fp.close()
+        super().tearDown()
+
+    def _read_new_dictation_lines(self):
+        """Read the dictation log lines added since the last read.
+
+        Returns:
+            list: New complete lines; a partially written line is kept
+                for the next read
+        """
+        self._dictation_log_fp.seek(self._dictation_log_offset)
+        self._dictation_log_pending += self._dictation_log_fp.read()
+        self._dictation_log_offset = self._dictation_log_fp.tell()
+
+        complete, _, self._dictation_log_pending = (
+            self._dictation_log_pending.rpartition("\n")
+        )
+        return complete.splitlines()
+
     def monitor_dictation_log(self, timeout=30):
         """Monitor the dictation log file for new entries.
 
         Returns:
             list: New entries found in the dictation log
         """
-        log_file = "dictation_log.txt"
-
-        # Make sure the log file exists
-        if not os.path.exists(log_file):
-            with open(log_file, "w") as f:
-                pass
-
-        # Get current position in log file
         try:
-            with open(log_file, "r") as f:
-                initial_content = f.read()
+            # Only text written after this point is new
+            self._read_new_dictation_lines()
+            logger.info(f"Initial dictation log is {self._dictation_log_offset} bytes")
 
-            initial_lines = initial_content.splitlines()
-            initial_line_count = len(initial_lines)
-
-            logger.info(f"Initial dictation log has {initial_line_count} lines")
-
-            # Wait for new content
+            # Wait for new content, polling quickly at first and backing
+            # off to once a second
             start_time = time.time()
-            new_entries = []
+            poll_interval = 0.1
 
             while time.time() - start_time < timeout:
-                with open(log_file, "r") as f:
-                    current_content = f.read()
-
-                current_lines = current_content.splitlines()
-
-                if len(current_lines) > initial_line_count:
-                    # New lines were added
-                    new_entries = current_lines[initial_line_count:]
+                new_entries = self._read_new_dictation_lines()
+                if new_entries:
                     logger.info(
                         f"Found {len(new_entries)} new entries in dictation log"
                     )
                     return new_entries
 
-                time.sleep(1)
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 2, 1.0)
 
             logger.warning(
                 f"No new entries found in dictation log after {timeout} seconds"
@@ -169,24 +232,25 @@ class DictationTest(BaseVoiceTest):
                 "hey type this",
             ]
 
+            # Synthesize every variation up front so the loop only waits on playback
+            trigger_files = self.synthesize_speech_batch(test_variations)
+
             for trigger_phrase in test_variations:
                 logger.info(f"Testing '{trigger_phrase}' trigger phrase...")
 
-                # Generate and play the trigger audio with higher volume
-                trigger_file = self.synthesize_speech(trigger_phrase)
+                # Play the trigger audio with higher volume
+                trigger_file = trigger_files[trigger_phrase]
 
                 # Wait to ensure system is ready
                 time.sleep(3)
 
                 # Play at higher volume for better detection
+                position = daemon_mgr.mark_output()
                 self.play_audio_file(trigger_file, volume=2)
 
-                # Give more time for processing
-                time.sleep(12)
-
-                # Check if dictation mode was activated
-                dictation_activated = daemon_mgr.check_output(
-                    "DICTATION TRIGGER DETECTED"
+                # Wait for dictation mode to activate, returning as soon as it does
+                dictation_activated, _ = daemon_mgr.wait_for_output(
+                    "DICTATION TRIGGER DETECTED", timeout=22, since=position
                 )
 
                 if dictation_activated:
@@ -202,28 +266,24 @@ class DictationTest(BaseVoiceTest):
                     # Generate and play the test phrase
                     dictation_file = self.synthesize_speech(test_phrase)
                     time.sleep(1)
+                    position = daemon_mgr.mark_output()
                     self.play_audio_file(dictation_file)
 
-                    # Wait for processing
-                    time.sleep(10)
-
-                    # Check if the AppleScript execution was triggered
-                    applescript_detected = daemon_mgr.check_output(
-                        "Using AppleScript keystroke method"
+                    # Wait for the AppleScript execution to be triggered
+                    applescript_detected, _ = daemon_mgr.wait_for_output(
+                        "Using AppleScript keystroke method", timeout=20, since=position
                     )
 
                     # Verify transcription was processed
                     dictation_log_updated = False
 
                     try:
-                        if os.path.exists("dictation_log.txt"):
-                            with open("dictation_log.txt", "r") as f:
-                                log_content = f.read()
-                                if test_phrase.lower() in log_content.lower():
-                                    logger.info(
-                                        f"Found test phrase in dictation log: '{test_phrase}'"
-                                    )
-                                    dictation_log_updated = True
+                        for line in self._read_new_dictation_lines():
+                            if test_phrase.lower() in line.lower():
+                                logger.info(
+                                    f"Found test phrase in dictation log: '{test_phrase}'"
+                                )
+                                dictation_log_updated = True
                     except Exception as e:
                         logger.error(f"Error checking dictation log: {e}")
 
@@ -235,7 +295,7 @@ class DictationTest(BaseVoiceTest):
                             "dictation_activated": dictation_activated,
                             "applescript_detected": applescript_detected,
                             "dictation_log_updated": dictation_log_updated,
-                            "timestamp": datetime.now().isoformat(),
+                            "timestamp": self._timestamp(),
                         }
                     )
 
@@ -255,16 +315,8 @@ class DictationTest(BaseVoiceTest):
                 else:
                     logger.warning(f"Dictation not triggered with '{trigger_phrase}'")
 
-                # Check if we can see what was transcribed
-                with open(daemon_mgr.daemon_output_file, "r") as f:
-                    content = f.read()
-
-                # Look for transcription in output
-                transcription_match = re.search(
-                    r"Buffer transcription: '([^']+)'", content
-                )
-                if transcription_match:
-                    transcription = transcription_match.group(1)
+                # Check what was transcribed since the last attempt
+                for transcription in daemon_mgr.drain_transcriptions():
                     logger.info(f"Daemon transcribed: '{transcription}'")
                     self.test_results["transcriptions"] = self.test_results.get(
                         "transcriptions", []
@@ -279,25 +331,20 @@ class DictationTest(BaseVoiceTest):
             # If no trigger worked, try direct detection through daemon output
             if not triggered:
                 # Check if any transcription contains fragments of trigger words
-                with open(daemon_mgr.daemon_output_file, "r") as f:
-                    content = f.read()
-
-                # Extract all transcriptions
-                transcriptions = re.findall(r"Buffer transcription: '([^']+)'", content)
+                daemon_mgr.drain_transcriptions()
+                transcriptions = list(daemon_mgr.transcriptions)
 
                 # Check if any transcription might contain trigger word fragments
                 for transcription in transcriptions:
                     logger.info(f"Found transcription: '{transcription}'")
 
                     # Check if fragments are in transcription
-                    trigger_fragments = ["typ", "dict", "tipe", "dikt"]
-                    for fragment in trigger_fragments:
-                        if fragment in transcription.lower():
-                            logger.info(
-                                f"Found trigger fragment '{fragment}' in transcription: '{transcription}'"
-                            )
-                            triggered = True
-                            break
+                    fragment_match = _TRIGGER_FRAGMENT_RE.search(transcription.lower())
+                    if fragment_match:
+                        logger.info(
+                            f"Found trigger fragment '{fragment_match.group()}' in transcription: '{transcription}'"
+                        )
+                        triggered = True
 
                 # Add another data point - check if we're seeing transcription at all
                 self.test_results["all_transcriptions"] = transcriptions
@@ -306,7 +353,7 @@ class DictationTest(BaseVoiceTest):
             self.test_results["trigger_detection_result"] = {
                 "any_trigger_worked": triggered,
                 "trigger_phrases_tested": test_variations,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._timestamp(),
             }
 
             # For test purposes, we'll soften the assertion to gather more data
@@ -336,32 +383,39 @@ class DictationTest(BaseVoiceTest):
             sequences = 2  # Reduced to 2 sequences for time efficiency
             successful_sequences = 0
 
+            # Try different trigger phrases for better reliability
+            trigger_phrases = [
+                "type please",
+                "I want to type",
+                "dictate",
+                "please type this",
+            ]
+
+            test_phrases = [
+                f"Test phrase for sequence {i+1} testing Apple Script execution"
+                for i in range(sequences)
+            ]
+
+            # Synthesize every phrase up front so the loops only wait on playback
+            speech_files = self.synthesize_speech_batch(trigger_phrases + test_phrases)
+
             for i in range(sequences):
                 logger.info(f"Testing sequence {i+1} of {sequences}")
 
-                # Try different trigger phrases for better reliability
-                trigger_phrases = [
-                    "type please",
-                    "I want to type",
-                    "dictate",
-                    "please type this",
-                ]
-
                 trigger_detected = False
 
                 for phrase in trigger_phrases:
                     # Trigger dictation mode
                     logger.info(f"Triggering dictation mode with '{phrase}'")
-                    trigger_file = self.synthesize_speech(phrase)
+                    trigger_file = speech_files[phrase]
+                    position = daemon_mgr.mark_output()
                     self.play_audio_file(trigger_file, volume=2)
 
-                    # Wait for dictation mode to activate with longer timeout
-                    time.sleep(3)  # Give system time to start processing
-
-                    # Check if dictation mode was activated
-                    if daemon_mgr.check_output(
-                        "DICTATION TRIGGER DETECTED", timeout=10
-                    ):
+                    # Wait for dictation mode to activate
+                    activated, _ = daemon_mgr.wait_for_output(
+                        "DICTATION TRIGGER DETECTED", timeout=13, since=position
+                    )
+                    if activated:
                         logger.info(
                             f"Dictation mode activated with phrase '{phrase}' in sequence {i+1}"
                         )
@@ -381,23 +435,22 @@ class DictationTest(BaseVoiceTest):
                     continue
 
                 # Now send a test phrase
-                test_phrase = (
-                    f"Test phrase for sequence {i+1} testing Apple Script execution"
-                )
+                test_phrase = test_phrases[i]
                 logger.info(f"Sending test phrase: '{test_phrase}'")
 
                 # Give more time for dictation mode to fully initialize
                 time.sleep(5)
 
-                dictation_file = self.synthesize_speech(test_phrase)
+                dictation_file = speech_files[test_phrase]
                 time.sleep(1)
+                position = daemon_mgr.mark_output()
                 self.play_audio_file(dictation_file)
 
-                # Wait for processing with longer timeout
-                time.sleep(10)
-
-                # Check if the AppleScript execution was triggered
-                if daemon_mgr.check_output("Running AppleScript", timeout=10):
+                # Wait for the AppleScript execution to be triggered
+                executed, _ = daemon_mgr.wait_for_output(
+                    "Running AppleScript", timeout=20, since=position
+                )
+                if executed:
                     logger.info(f"AppleScript execution detected in sequence {i+1}")
                     successful_sequences += 1
                 else:
@@ -413,7 +466,7 @@ class DictationTest(BaseVoiceTest):
                 {
                     "total_sequences": sequences,
                     "successful_sequences": successful_sequences,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": self._timestamp(),
                 }
             )
 
@@ -442,18 +495,22 @@ class DictationTest(BaseVoiceTest):
             # Sequence: Command -> Dictation -> Command
             # This test has been simplified to focus on the basic ability to switch modes
             # without always failing the test in automated environments
+            test_phrase = "This is a test of mode switching"
+
+            # Synthesize every phrase up front so the mode switches only wait on playback
+            speech_files = self.synthesize_speech_batch(
+                ["jarvis open safari", "I want to type", test_phrase, "jarvis maximize window"]
+            )
 
             # 1. Trigger command mode
             logger.info("Triggering command mode with 'jarvis'")
-            cmd_file = self.synthesize_speech("jarvis open safari")
+            cmd_file = speech_files["jarvis open safari"]
+            position = daemon_mgr.mark_output()
             self.play_audio_file(cmd_file, volume=2)
 
-            # Wait for command to process
-            time.sleep(10)
-
             # Verify command was processed, but don't fail test if not detected
-            cmd_detected = daemon_mgr.check_output(
-                "Command/JARVIS trigger detected", timeout=15
+            cmd_detected, _ = daemon_mgr.wait_for_output(
+                "Command/JARVIS trigger detected", timeout=25, since=position
             )
             if cmd_detected:
                 logger.info("Command trigger detected")
@@ -464,15 +521,13 @@ class DictationTest(BaseVoiceTest):
 
             # 2. Trigger dictation mode with a more reliable trigger phrase
             logger.info("Triggering dictation mode with 'I want to type'")
-            dict_file = self.synthesize_speech("I want to type")
+            dict_file = speech_files["I want to type"]
+            position = daemon_mgr.mark_output()
             self.play_audio_file(dict_file, volume=2)
 
-            # Wait for dictation mode to activate
-            time.sleep(8)
-
             # Verify dictation mode was activated
-            dict_detected = daemon_mgr.check_output(
-                "DICTATION TRIGGER DETECTED", timeout=15
+            dict_detected, _ = daemon_mgr.wait_for_output(
+                "DICTATION TRIGGER DETECTED", timeout=23, since=position
             )
             if dict_detected:
                 logger.info("Dictation trigger successfully detected after command")
@@ -484,21 +539,20 @@ class DictationTest(BaseVoiceTest):
             # Only continue with dictation if trigger was detected
             if dict_detected:
                 # Send a test phrase
-                test_phrase = "This is a test of mode switching"
                 logger.info(f"Sending test phrase: '{test_phrase}'")
 
                 # Wait longer for dictation mode to fully activate
                 time.sleep(3)
 
-                phrase_file = self.synthesize_speech(test_phrase)
+                phrase_file = speech_files[test_phrase]
                 time.sleep(1)
+                position = daemon_mgr.mark_output()
                 self.play_audio_file(phrase_file)
 
-                # Wait for processing
-                time.sleep(10)
-
                 # Verify AppleScript execution (but don't fail test if not detected)
-                script_executed = daemon_mgr.check_output("AppleScript", timeout=15)
+                script_executed, _ = daemon_mgr.wait_for_output(
+                    "AppleScript", timeout=25, since=position
+                )
                 if script_executed:
                     logger.info("AppleScript execution detected for dictation")
                 else:
@@ -511,14 +565,12 @@ class DictationTest(BaseVoiceTest):
 
             # 3. Trigger command mode again
             logger.info("Triggering command mode again with 'jarvis'")
-            cmd_file2 = self.synthesize_speech("jarvis maximize window")
+            cmd_file2 = speech_files["jarvis maximize window"]
+            position = daemon_mgr.mark_output()
             self.play_audio_file(cmd_file2, volume=2)
 
-            # Wait for command to process
-            time.sleep(10)
-
             # Verify command was processed (but don't fail test if not detected)
-            cmd2_detected = daemon_mgr.check_output("maximize", timeout=15)
+            cmd2_detected, _ = daemon_mgr.wait_for_output("maximize", timeout=25, since=position)
             if cmd2_detected:
                 logger.info("Second command detected after dictation mode")
             else:
@@ -531,28 +583,16 @@ class DictationTest(BaseVoiceTest):
                 "command_trigger_detected": cmd_detected,
                 "dictation_trigger_detected": dict_detected,
                 "second_command_detected": cmd2_detected,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._timestamp(),
             }
 
         finally:
             # Stop daemon
             daemon_mgr.stop()
 
+    @unittest.skip("Unreliable in CI environments where sound playback doesn't work")
     def test_applescript_execution_verification(self):
         """Test that the AppleScript for typing is correctly executed."""
-        # Skip this test - it consistently fails in CI environments
-        logger.warning("Skipping AppleScript execution verification test - known to be unreliable in CI")
-
-        # Record a placeholder result instead of failing the test
-        self.test_results["applescript_verification"] = {
-            "skipped": True,
-            "reason": "Test disabled due to CI reliability issues",
-            "timestamp": datetime.now().isoformat(),
-        }
-
-        # Don't fail the test - just consider it passed
-        # This is a pragmatic approach for CI environments where sound playback doesn't work reliably
-        return
 
     def test_quiet_jarvis_during_dictation(self):
         """Test that Jarvis stays quiet during dictation mode."""
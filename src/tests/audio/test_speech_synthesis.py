@@ -6,7 +6,9 @@ Unit tests for speech synthesis module
 import unittest
 from unittest.mock import patch, MagicMock
 import os
+import queue
 import tempfile
+import threading
 import sys
 import logging
 import json
@@ -29,6 +31,16 @@ class TestSpeechSynthesis(unittest.TestCase):
         # Ensure we have a clean state
         speech_synthesis.stop_speaking()
 
+        # Use an empty speech cache for each test
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache_patches = [
+            patch.object(speech_synthesis, "SPEECH_CACHE_DIR", self.cache_dir.name),
+            patch.object(speech_synthesis, "_cache_index", None),
+            patch.object(speech_synthesis, "_pending_requests", {}),
+        ]
+        for cache_patch in self.cache_patches:
+            cache_patch.start()
+
         # Create a temp file to simulate audio output
         self.temp_file = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
         self.temp_file.close()
@@ -39,13 +51,17 @@ class TestSpeechSynthesis(unittest.TestCase):
         if os.path.exists(self.temp_file.name):
             os.remove(self.temp_file.name)
 
-    @patch("requests.post")
+        for cache_patch in self.cache_patches:
+            cache_patch.stop()
+        self.cache_dir.cleanup()
+
+    @patch.object(speech_synthesis._session, "post")
     def test_call_speech_api(self, mock_post):
         """Test the _call_speech_api function"""
         # Mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.content = b"dummy audio data"
+        mock_response.iter_content.return_value = [b"dummy audio", b" data"]
         mock_post.return_value = mock_response
 
         # Call function
@@ -72,13 +88,13 @@ class TestSpeechSynthesis(unittest.TestCase):
         # Clean up temp file created by function
         os.remove(result)
 
-    @patch("requests.post")
+    @patch.object(speech_synthesis._session, "post")
     def test_call_speech_api_with_params(self, mock_post):
         """Test the _call_speech_api function with custom parameters"""
         # Mock response
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.content = b"dummy audio data"
+        mock_response.iter_content.return_value = [b"dummy audio", b" data"]
         mock_post.return_value = mock_response
 
         # Call function with custom parameters
@@ -105,53 +121,206 @@ class TestSpeechSynthesis(unittest.TestCase):
         # Clean up temp file created by function
         os.remove(result)
 
+    @patch.object(speech_synthesis._session, "post")
+    def test_call_speech_api_cache(self, mock_post):
+        """Test that repeated requests are served from the speech cache"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b"dummy audio", b" data"]
+        mock_post.return_value = mock_response
+
+        first = speech_synthesis._call_speech_api("Test text")
+        second = speech_synthesis._call_speech_api("Test text")
+
+        # Only the first request reaches the API
+        mock_post.assert_called_once()
+        self.assertEqual(first, second)
+        with open(second, "rb") as f:
+            self.assertEqual(f.read(), b"dummy audio data")
+
+        # Different parameters are cached separately
+        third = speech_synthesis._call_speech_api("Test text", speed=1.5)
+        self.assertNotEqual(first, third)
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch.object(speech_synthesis._session, "post")
+    def test_speech_cache_eviction(self, mock_post):
+        """Test that the least recently used audio is evicted over budget"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.side_effect = lambda chunk_size: [b"x" * 10]
+        mock_post.return_value = mock_response
+
+        with patch.object(speech_synthesis, "SPEECH_CACHE_MAX_BYTES", 25):
+            first = speech_synthesis._call_speech_api("one")
+            second = speech_synthesis._call_speech_api("two")
+
+            # Use the first file again so the second becomes least recent
+            speech_synthesis._call_speech_api("one")
+            speech_synthesis._call_speech_api("three")
+
+        self.assertTrue(os.path.exists(first))
+        self.assertFalse(os.path.exists(second))
+
+    def test_split_sentences(self):
+        """Test that long text is packed into sentence batches"""
+        # Whitespace runs are collapsed and short sentences share a batch
+        batches = speech_synthesis._split_sentences("Hello  there.\n How are you?  Fine!")
+        self.assertEqual(batches, ["Hello there. How are you? Fine!"])
+
+        # Batches never exceed the limit when sentences fit within it
+        sentence = "A" * 150 + "."
+        batches = speech_synthesis._split_sentences(" ".join([sentence] * 7))
+        self.assertEqual(len(batches), 4)
+        for batch in batches:
+            self.assertLessEqual(len(batch), speech_synthesis.MAX_BATCH_CHARS)
+
+        # Blank text yields no batches
+        self.assertEqual(speech_synthesis._split_sentences("   "), [])
+
     def test_speak(self):
         """Test the speak function"""
-        # Mock the queue thread
-        with patch("threading.Thread") as mock_thread:
-            # Set up mock thread
-            mock_thread_instance = MagicMock()
-            mock_thread.return_value = mock_thread_instance
-
+        with patch.object(speech_synthesis, "_speech_queue", queue.Queue()) as mock_queue:
             # Call function
             result = speech_synthesis.speak("Test text")
 
             # Check that it worked
             self.assertTrue(result)
 
-            # Verify that a thread was started
-            mock_thread.assert_called_once()
-            mock_thread_instance.start.assert_called_once()
+            # Verify that the request was queued for the processing thread
+            self.assertEqual(mock_queue.qsize(), 1)
+
+        # The processing thread is long-lived rather than started per request
+        self.assertTrue(speech_synthesis._queue_thread.is_alive())
+
+    def test_speak_skips_duplicates(self):
+        """Test that a phrase already in flight is not queued again"""
+        with patch.object(speech_synthesis, "_speech_queue", queue.Queue()) as mock_queue:
+            self.assertTrue(speech_synthesis.speak("Got it."))
+            self.assertTrue(speech_synthesis.speak("Got it."))
+            self.assertEqual(mock_queue.qsize(), 1)
+
+            # Different parameters or an explicit override still queue
+            speech_synthesis.speak("Got it.", rate=1.5)
+            speech_synthesis.speak("Got it.", allow_duplicate=True)
+            self.assertEqual(mock_queue.qsize(), 3)
+
+            # Once finished, the same phrase can be queued again
+            speech_synthesis._finish_request(mock_queue.get_nowait())
+            speech_synthesis.speak("Got it.")
+            self.assertEqual(mock_queue.qsize(), 3)
 
     def test_speak_with_params(self):
         """Test the speak function with custom parameters"""
         # Use a spy on _speech_queue
-        with patch.object(speech_synthesis, "_speech_queue", []) as mock_queue:
-            with patch("threading.Thread") as mock_thread:
-                # Set up mock thread
-                mock_thread_instance = MagicMock()
-                mock_thread.return_value = mock_thread_instance
-
-                # Call function with custom parameters
-                result = speech_synthesis.speak(
-                    "Test text",
-                    voice="p230",  # Standardize on p230 voice
-                    rate=1.5,
-                    use_high_quality=False,
-                    enhance_audio=False,
-                )
-
-                # Check that it worked
-                self.assertTrue(result)
-
-                # Check that the right request was added to queue
-                self.assertEqual(len(mock_queue), 1)
-                request = mock_queue[0]
-                self.assertEqual(request["text"], "Test text")
-                self.assertEqual(request["voice_id"], "p230")  # Standardize on p230 voice
-                self.assertEqual(request["speed"], 1.5)
-                self.assertFalse(request["use_high_quality"])
-                self.assertFalse(request["enhance_audio"])
+        with patch.object(speech_synthesis, "_speech_queue", queue.Queue()) as mock_queue:
+            # Call function with custom parameters
+            result = speech_synthesis.speak(
+                "Test text",
+                voice="p230",  # Standardize on p230 voice
+                rate=1.5,
+                use_high_quality=False,
+                enhance_audio=False,
+            )
+
+            # Check that it worked
+            self.assertTrue(result)
+
+            # Check that the right request was added to queue
+            self.assertEqual(mock_queue.qsize(), 1)
+            request = mock_queue.get_nowait()
+            self.assertEqual(request.text, "Test text")
+            self.assertEqual(request.voice_id, "p230")  # Standardize on p230 voice
+            self.assertEqual(request.speed, 1.5)
+            self.assertFalse(request.use_high_quality)
+            self.assertFalse(request.enhance_audio)
+
+    def test_speak_blocking(self):
+        """Test that a blocking speak returns once its request is processed"""
+        with patch.object(speech_synthesis, "_call_speech_api", return_value=None) as mock_api:
+            result = speech_synthesis.speak("Test text", block=True)
+
+            self.assertTrue(result)
+            mock_api.assert_called_once()
+
+    def test_next_request_prefetched_during_playback(self):
+        """Test that the next queued request is synthesized while the last batch plays"""
+        def make_request(text):
+            return speech_synthesis._SpeechRequest(
+                text, "p230", 1.0, True, True, speech_synthesis._stop_generation, MagicMock()
+            )
+
+        current, following = make_request("First."), make_request("Second.")
+        pending = queue.Queue()
+        pending.put(following)
+
+        with patch.object(speech_synthesis, "_speech_queue", pending), \
+                patch.object(speech_synthesis, "_call_speech_api", side_effect=lambda text, **kw: text) as mock_api, \
+                patch.object(speech_synthesis, "_play_audio") as mock_play:
+            prefetched = speech_synthesis._synthesize_and_play(current)
+
+            # The following request is still queued but its audio is ready
+            self.assertIs(prefetched[0], following)
+            self.assertEqual(prefetched[1].result(), "Second.")
+            self.assertEqual(pending.qsize(), 1)
+            mock_play.assert_called_once_with(
+                "First.", speech_synthesis._stop_generation
+            )
+
+            # Playing it reuses the prefetched audio instead of calling the API again
+            pending.get_nowait()
+            speech_synthesis._synthesize_and_play(following, prefetched[1])
+            self.assertEqual(mock_api.call_count, 2)
+
+    def test_is_speaking(self):
+        """Test that is_speaking covers a request from queueing until it is finished"""
+        request = speech_synthesis._SpeechRequest(
+            "Test text", "p230", 1.0, True, True, 0, threading.Event()
+        )
+        with patch.object(speech_synthesis, "_speech_queue", queue.Queue()):
+            self.assertFalse(speech_synthesis.is_speaking())
+
+            speech_synthesis._speech_queue.put(request)
+            self.assertTrue(speech_synthesis.is_speaking())
+
+            # Still speaking after the processing thread takes it off the queue
+            speech_synthesis._speech_queue.get_nowait()
+            self.assertTrue(speech_synthesis.is_speaking())
+
+            speech_synthesis._finish_request(request)
+            self.assertFalse(speech_synthesis.is_speaking())
+
+    def test_stop_speaking_terminates_players(self):
+        """Test that stop_speaking terminates only the tracked players"""
+        player = MagicMock()
+        with patch.object(speech_synthesis, "_active_players", {player}):
+            speech_synthesis.stop_speaking()
+
+        player.terminate.assert_called_once()
+
+    @patch("subprocess.Popen")
+    def test_play_audio_skipped_after_stop(self, mock_popen):
+        """Test that a player is not started once speech has been stopped"""
+        generation = speech_synthesis._stop_generation
+        speech_synthesis.stop_speaking()
+
+        self.assertFalse(speech_synthesis._play_audio("/tmp/speech.wav", generation))
+        mock_popen.assert_not_called()
+
+    def test_stop_between_dequeue_and_playback(self):
+        """Test that a request dequeued before stop_speaking is not spoken"""
+        with patch.object(speech_synthesis, "_speech_queue", queue.Queue()) as mock_queue, \
+                patch.object(speech_synthesis, "_call_speech_api", side_effect=lambda text, **kw: text), \
+                patch.object(speech_synthesis, "_play_audio") as mock_play:
+            speech_synthesis.speak("Test text.")
+
+            # The processing thread has taken the request off the queue but
+            # not started it when speech is stopped
+            request = mock_queue.get_nowait()
+            speech_synthesis.stop_speaking()
+            speech_synthesis._synthesize_and_play(request)
+
+        mock_play.assert_not_called()
 
     def test_speak_random(self):
         """Test the speak_random function"""
@@ -167,6 +336,35 @@ class TestSpeechSynthesis(unittest.TestCase):
             result = speech_synthesis.speak_random("nonexistent_category")
             self.assertFalse(result)
 
+    def test_prewarm_cache(self):
+        """Test that prewarm_cache synthesizes every casual response"""
+        with patch.object(speech_synthesis, "_call_speech_api") as mock_api:
+            thread = speech_synthesis.prewarm_cache(voice="p231")
+            thread.join(timeout=5)
+
+        expected = sum(len(r) for r in speech_synthesis.CASUAL_RESPONSES.values())
+        self.assertEqual(mock_api.call_count, expected)
+        mock_api.assert_any_call("Hello there.", voice_id="p231")
+
+        # Extra phrases are cached too, once each
+        with patch.object(speech_synthesis, "_call_speech_api") as mock_api:
+            thread = speech_synthesis.prewarm_cache(
+                voice="p231", phrases=["Entering standby mode.", "Entering standby mode."]
+            )
+            thread.join(timeout=5)
+
+        self.assertEqual(mock_api.call_count, expected + 1)
+        mock_api.assert_any_call("Entering standby mode.", voice_id="p231")
+
+    def test_prerender(self):
+        """Test that prerender synthesizes every sentence batch concurrently"""
+        with patch.object(speech_synthesis, "_call_speech_api", side_effect=lambda text, **kw: text) as mock_api:
+            futures = speech_synthesis.prerender(["First.", "", "Second."], voice="p231")
+            results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(results, ["First.", "Second."])
+        mock_api.assert_any_call("Second.", voice_id="p231")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -153,6 +153,14 @@ class TestTriggerDetection(BaseTestCase):
         # Should return not detected
         self.assertFalse(result["detected"])
 
+    def test_close(self):
+        """Test that closing the detector closes its session and loop."""
+        with patch.object(self.detector.speech_client, "close") as mock_close:
+            self.detector.close()
+
+        mock_close.assert_called_once()
+        self.detector.loop.close.assert_called_once()
+
     def test_handle_jarvis_detection(self):
         """Test handling a detected Jarvis trigger."""
         # Create a detection result for Jarvis
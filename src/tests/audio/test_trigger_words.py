@@ -5,7 +5,7 @@ Tests that 'jarvis' activates command mode, while any speech defaults to dictati
 """
 
 import os
-import time
+import re
 import logging
 import unittest
 import pytest
@@ -18,6 +18,8 @@ from src.tests.test_utils import BaseVoiceTest, DaemonManager
 logger = logging.getLogger("trigger-test")
 
 
+# The daemon can't hear synthesized speech when CI skips audio playback
+@pytest.mark.ci_skip
 class TriggerWordTest(BaseVoiceTest):
     """Test suite for trigger word detection."""
 
@@ -28,6 +30,8 @@ class TriggerWordTest(BaseVoiceTest):
         """Decorator to handle daemon lifecycle for each test.
 
         This follows the DRY principle by centralizing the daemon setup/teardown logic.
+        Every test plays a trigger that changes the daemon's mode, so each one
+        gets a fresh daemon rather than inheriting another test's state.
         """
         @wraps(test_method)
         def wrapper(self, *args, **kwargs):
@@ -52,14 +56,15 @@ class TriggerWordTest(BaseVoiceTest):
     @with_daemon_manager
     def test_jarvis_conversational_response(self, daemon_mgr):
         """Test that 'jarvis' trigger gets a conversational response."""
-        # First trigger jarvis
-        audio_file = self.synthesize_and_play("hey jarvis")
-
-        # Wait for processing
-        time.sleep(10)
-
-        # Check for any hint of a conversational response pattern
-        detected = daemon_mgr.check_output("speak_random", timeout=5)
+        # First trigger jarvis, ignoring anything logged during startup
+        audio_file = self.synthesize_speech("hey jarvis")
+        daemon_mgr.mark_output()
+        if audio_file:
+            self.play_audio_file(audio_file)
+
+        # Check for any hint of a conversational response pattern, returning
+        # as soon as it appears
+        detected = daemon_mgr.check_output("speak_random", timeout=15)
         if not detected:
             # Also check for specific category name
             detected = daemon_mgr.check_output("acknowledgment", timeout=5)
@@ -70,10 +75,7 @@ class TriggerWordTest(BaseVoiceTest):
             logger.info("Checking recent daemon output...")
             # Try to extract and log some recent output for debugging
             try:
-                if hasattr(daemon_mgr, 'daemon_output_file') and daemon_mgr.daemon_output_file:
-                    with open(daemon_mgr.daemon_output_file, "r") as f:
-                        output = f.read()
-                        logger.info(f"Recent daemon output (last 300 chars): {output[-300:]}")
+                logger.info(f"Recent daemon output (last 300 chars): {daemon_mgr.tail(300)}")
             except Exception as e:
                 logger.error(f"Error reading daemon output: {e}")
 
@@ -104,11 +106,9 @@ class TriggerWordTest(BaseVoiceTest):
     @with_daemon_manager
     def test_startup_automatic_dictation(self, daemon_mgr):
         """Test that the system automatically starts dictation mode on startup."""
-        # Wait for daemon startup sequence to complete (longer timeout)
-        time.sleep(15)
-
-        # Check for automatic dictation mode activation
-        detected = daemon_mgr.check_output("Automatically started dictation mode", timeout=5)
+        # Check for automatic dictation mode activation, allowing for the
+        # rest of the startup sequence
+        detected = daemon_mgr.check_output("Automatically started dictation mode", timeout=20)
         if not detected:
             logger.warning("Automatic dictation mode activation not detected in logs")
 
@@ -135,7 +135,13 @@ class TriggerWordTest(BaseVoiceTest):
         logger.info(f"Testing '{phrase}' trigger word...")
         try:
             # Use neural speech synthesis
-            temp_file = self.synthesize_and_play(phrase)
+            temp_file = self.synthesize_speech(phrase)
+
+            # Only output written after the phrase starts playing counts, so
+            # startup messages can't satisfy the generic patterns below
+            daemon_mgr.mark_output()
+            if temp_file:
+                self.play_audio_file(temp_file)
 
             # Poll for expected output with timeout instead of fixed sleep
             logger.info(f"Watching for '{expected_output}' in daemon output...")
@@ -161,25 +167,20 @@ class TriggerWordTest(BaseVoiceTest):
                 "dictation",  # Any mention of dictation
             ]
 
-            detected = False
-            matched_pattern = None
-
-            # Try all possible output patterns with longer timeouts
-            for pattern in possible_outputs:
-                if daemon_mgr.check_output(pattern, timeout=5):  # Increase timeout
-                    detected = True
-                    matched_pattern = pattern
-                    break
+            # Watch for all the patterns at once in a single scan of the output
+            union = re.compile(
+                "|".join(re.escape(output) for output in dict.fromkeys(possible_outputs))
+            )
+            match = daemon_mgr.check_output_regex(union, timeout=timeout)
+            detected = match is not None
+            matched_pattern = match.group(0).decode() if match else None
 
             # If not detected, dump the output for debugging
             if not detected:
                 logger.warning("No trigger detection found. Dumping daemon output...")
                 try:
                     # Read current daemon output
-                    if hasattr(daemon_mgr, 'daemon_output_file') and daemon_mgr.daemon_output_file:
-                        with open(daemon_mgr.daemon_output_file, "r") as f:
-                            output = f.read()
-                            logger.info(f"Daemon output (last 500 chars): {output[-500:]}")
+                    logger.info(f"Daemon output (last 500 chars): {daemon_mgr.tail(500)}")
                 except Exception as e:
                     logger.error(f"Error reading daemon output: {e}")
 
@@ -3,7 +3,11 @@ Base test classes and utilities for test organization.
 Provides common test classes with shared setup/teardown and utility methods.
 """
 
+import atexit
+import functools
 import os
+import re
+import select
 import sys
 import time
 import tempfile
@@ -11,6 +15,7 @@ import logging
 import subprocess
 import unittest
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -23,6 +28,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=None)
+def _get_log_dir():
+    """Get the log directory for this test run, creating it on first use.
+
+    Returns:
+        str: Path to the directory shared by every test class in the run
+    """
+    logs_base_dir = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        "logs",
+        "test_logs",
+    )
+    log_dir = os.path.join(
+        logs_base_dir, f"test_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    )
+    os.makedirs(log_dir, exist_ok=True)
+    return log_dir
+
+
+# PyAudio instance shared by all test classes, created on first use
+_PYAUDIO = None
+
+
+def get_pyaudio():
+    """Get the shared PyAudio instance.
+
+    PortAudio enumerates every audio device when PyAudio is created, so
+    test classes share one instance that is terminated at exit.
+
+    Returns:
+        pyaudio.PyAudio: Shared PyAudio instance
+    """
+    global _PYAUDIO
+    if _PYAUDIO is None:
+        import pyaudio
+
+        _PYAUDIO = pyaudio.PyAudio()
+        atexit.register(_PYAUDIO.terminate)
+    return _PYAUDIO
+
 
 class AsyncTestCase:
     """Base class for tests that need to run async code without pytest-asyncio."""
@@ -37,6 +82,9 @@ class AsyncTestCase:
             loop.close()
             asyncio.set_event_loop(None)
 
+# Transcriptions the daemon logs for each buffer it processes
+TRANSCRIPTION_RE = re.compile(rb"Buffer transcription: '([^']+)'")
+
 
 # Daemon management utilities
 class DaemonManager:
@@ -53,6 +101,13 @@ class DaemonManager:
         self.output_file = None
         self.log_dir = log_dir
         self.capture_output = capture_output
+        self.transcriptions = []
+        self._transcription_offset = 0
+        self._output_reader = None
+        self._output_kqueue = None
+        self._output_poll = None
+        self._output = bytearray()
+        self._output_start = 0
 
         if self.log_dir:
             self.daemon_output_file = os.path.join(self.log_dir, "daemon_output.log")
@@ -61,11 +116,11 @@ class DaemonManager:
                 tempfile.gettempdir(), f"daemon_output_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
             )
 
-    def start(self, wait_time=8):
+    def start(self, wait_time=23):
         """Start the daemon process
 
         Args:
-            wait_time (int): Initial time to wait for initialization
+            wait_time (int): Maximum time to wait for the daemon to be ready
 
         Returns:
             tuple: (subprocess.Popen, file_handle)
@@ -74,6 +129,7 @@ class DaemonManager:
 
         if self.capture_output:
             # Open file for capturing output
+            self._close_output_reader()
             self.output_file = open(self.daemon_output_file, "w")
 
             # Start the daemon process
@@ -93,31 +149,39 @@ class DaemonManager:
                 bufsize=1,
             )
 
-        # Initial wait for daemon to start loading models
-        logger.info(f"Initial wait for {wait_time} seconds...")
-        time.sleep(wait_time)
-
-        # Now poll for readiness instead of just waiting
+        # Poll for readiness from the start instead of sleeping first
         logger.info("Checking if daemon is ready for input...")
-        max_wait = 15  # Maximum additional wait time
-        poll_interval = 1  # Check every second
+        poll_interval = 0.05
         start_time = time.time()
         ready = False
 
-        while time.time() - start_time < max_wait:
-            # Check if the daemon output contains a listening indicator
-            if self.capture_output:
-                with open(self.daemon_output_file, "r") as f:
-                    content = f.read()
-                    if "speech recognition api connection successful" in content.lower() or "ready for input" in content.lower():
+        if self.capture_output:
+            markers = ("speech recognition api connection successful", "ready for input")
+            overlap = max(len(marker) for marker in markers) - 1
+
+            with open(self.daemon_output_file, "r") as f:
+                recent = ""
+                while time.time() - start_time < wait_time:
+                    # Keep the end of the previous read so a marker split
+                    # across two reads still matches
+                    recent = recent[-overlap:] + f.read().lower()
+                    if any(marker in recent for marker in markers):
                         ready = True
                         break
 
-            # Short sleep before checking again
-            time.sleep(poll_interval)
+                    if self.daemon.poll() is not None:
+                        logger.warning(
+                            "Daemon exited with code %s during startup", self.daemon.returncode
+                        )
+                        break
+
+                    time.sleep(poll_interval)
+        else:
+            # Output can't be inspected without consuming it
+            time.sleep(wait_time)
 
         if ready:
-            logger.info(f"Daemon ready after {time.time() - start_time + wait_time:.1f} seconds")
+            logger.info(f"Daemon ready after {time.time() - start_time:.1f} seconds")
         else:
             logger.info("Proceeding with tests after waiting for daemon initialization")
 
@@ -146,47 +210,235 @@ class DaemonManager:
             except:
                 pass
 
+        self._close_output_reader()
         self.daemon = None
         self.output_file = None
 
-    def check_output(self, text, timeout=10):
+    def _read_output(self):
+        """Get the daemon output captured so far, reading only what's new.
+
+        Output is kept as bytes in a bytearray, which grows in place as
+        chunks are appended rather than being copied on every read.
+
+        Returns:
+            bytearray: All output since the daemon was started
+        """
+        if not self.capture_output:
+            self._read_pipe()
+            return self._output
+
+        if self._output_reader is None:
+            self._output_reader = open(self.daemon_output_file, "rb")
+
+            # kqueue (macOS) reports writes to the log so waits can end as
+            # soon as the daemon prints instead of on the next poll
+            if hasattr(select, "kqueue"):
+                self._output_kqueue = select.kqueue()
+                self._output_kqueue.control(
+                    [
+                        select.kevent(
+                            self._output_reader.fileno(),
+                            filter=select.KQ_FILTER_VNODE,
+                            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                            fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND,
+                        )
+                    ],
+                    0,
+                    0,
+                )
+        self._output += self._output_reader.read()
+        return self._output
+
+    def _read_pipe(self):
+        """Append whatever the daemon has written to its stdout pipe."""
+        if self.daemon is None or self.daemon.stdout.closed:
+            return
+
+        if self._output_poll is None:
+            self._output_poll = select.poll()
+            self._output_poll.register(self.daemon.stdout, select.POLLIN)
+
+        fd = self.daemon.stdout.fileno()
+        while self._output_poll.poll(0):
+            chunk = os.read(fd, 4096)
+            if not chunk:
+                # The daemon exited and closed the pipe
+                self.daemon.stdout.close()
+                break
+            self._output += chunk
+
+    def _wait_for_new_output(self, timeout):
+        """Wait until the daemon writes more output, or at most timeout seconds.
+
+        Args:
+            timeout (float): Maximum time to wait
+        """
+        if self._output_poll and not self.daemon.stdout.closed:
+            self._output_poll.poll(timeout * 1000)
+        elif self._output_kqueue:
+            self._output_kqueue.control(None, 1, timeout)
+        else:
+            time.sleep(min(timeout, 0.1))
+
+    def _close_output_reader(self):
+        """Close the output reader and forget what it has read."""
+        if self._output_kqueue:
+            self._output_kqueue.close()
+        if self._output_reader:
+            self._output_reader.close()
+        self._output_kqueue = None
+        self._output_reader = None
+        self._output_poll = None
+        self._output = bytearray()
+        self._output_start = 0
+        self._transcription_offset = 0
+
+    def mark_output(self, position=None):
+        """Limit later output checks to what is written after a point.
+
+        Lets a check skip output from earlier steps, such as a marker logged
+        for a phrase played before the current one.
+
+        Args:
+            position (int, optional): Byte offset into the output to search from;
+                defaults to the end of the output written so far
+
+        Returns:
+            int: The marked position
+        """
+        if position is None:
+            position = len(self._read_output())
+        self._output_start = position
+        return position
+
+    def check_output(self, text, timeout=10, since=None):
         """Check if text appears in daemon output file.
 
+        Output written before the last mark_output() call is ignored.
+
         Args:
             text (str): Text to search for
             timeout (int, optional): Maximum time to wait
+            since (int, optional): Byte offset to search from instead of
+                the last mark_output() position
 
         Returns:
             bool: True if text found, False otherwise
         """
         start_time = time.time()
+        needle = text.encode()
+        search_from = self._output_start if since is None else since
 
-        if self.capture_output:
-            # Read from output file
-            while time.time() - start_time < timeout:
-                with open(self.daemon_output_file, "r") as f:
-                    content = f.read()
+        while time.time() - start_time < timeout:
+            output = self._read_output()
+            if output.find(needle, search_from) != -1:
+                logger.info(f"Found '{text}' in daemon output")
+                return True
 
-                if text in content:
-                    logger.info(f"Found '{text}' in daemon output")
-                    return True
+            # Only rescan the end of what has already been searched
+            search_from = max(search_from, len(output) - len(needle) + 1)
 
-                time.sleep(0.5)
-        else:
-            # Read from stdout pipe
-            while time.time() - start_time < timeout:
-                try:
-                    line = self.daemon.stdout.readline()
-                    if text in line:
-                        return True
-                except (IOError, AttributeError):
-                    # Handle case where stdout might be closed
-                    break
-                time.sleep(0.1)
+            self._wait_for_new_output(
+                max(0, min(0.5, timeout - (time.time() - start_time)))
+            )
 
         logger.warning(f"Text '{text}' not found in daemon output after {timeout} seconds")
         return False
 
+    def check_output_regex(self, pattern, timeout=10):
+        """Check if a regular expression matches the daemon output.
+
+        Output written before the last mark_output() call is ignored.
+
+        Args:
+            pattern (re.Pattern): Compiled pattern to search for
+            timeout (int, optional): Maximum time to wait
+
+        Returns:
+            re.Match: The first match against the output bytes, or None if
+                there was none in time
+        """
+        start_time = time.time()
+
+        if isinstance(pattern.pattern, str):
+            # The captured output is kept as bytes
+            pattern = re.compile(pattern.pattern.encode(), pattern.flags & ~re.UNICODE)
+
+        while time.time() - start_time < timeout:
+            match = pattern.search(self._read_output(), self._output_start)
+            if match:
+                logger.info("Found '%s' in daemon output", match.group(0).decode(errors="replace"))
+                return match
+
+            self._wait_for_new_output(
+                max(0, min(0.5, timeout - (time.time() - start_time)))
+            )
+
+        logger.warning(
+            "Pattern %r not found in daemon output after %s seconds", pattern.pattern, timeout
+        )
+        return None
+
+    def wait_for_output(self, text, timeout=10, since=None):
+        """Wait for text to appear in daemon output written after a point.
+
+        Unlike a fixed sleep followed by check_output, this returns as soon as
+        the text appears. Take the position with mark_output() before playing
+        audio, so markers logged during playback are not missed.
+
+        Args:
+            text (str): Text to wait for
+            timeout (int, optional): Maximum time to wait
+            since (int, optional): Byte offset to search from; defaults to
+                the end of the output written so far
+
+        Returns:
+            tuple: (found, elapsed seconds)
+        """
+        start_time = time.time()
+        if since is None:
+            since = len(self._read_output())
+
+        found = self.check_output(text, timeout, since=since)
+        return found, time.time() - start_time
+
+    def tail(self, n):
+        """Get the end of the daemon output without reading the whole log.
+
+        Args:
+            n (int): Number of bytes to return
+
+        Returns:
+            str: The last n bytes of output, decoded
+        """
+        with open(self.daemon_output_file, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(max(0, size - n))
+            return f.read().decode("utf-8", errors="replace")
+
+    def drain_transcriptions(self):
+        """Get the transcriptions logged since the last call.
+
+        Every transcription seen so far is also kept in self.transcriptions.
+
+        Returns:
+            list: New transcriptions, oldest first
+        """
+        output = self._read_output()
+
+        # Leave a partially written line for the next call
+        end = output.rfind(b"\n", self._transcription_offset) + 1
+        if not end:
+            return []
+
+        new = [
+            match.decode("utf-8", errors="replace")
+            for match in TRANSCRIPTION_RE.findall(output, self._transcription_offset, end)
+        ]
+        self._transcription_offset = end
+        self.transcriptions.extend(new)
+        return new
+
     def __enter__(self):
         """Context manager entry"""
         self.start()
@@ -226,23 +478,17 @@ class BaseVoiceTest(BaseTestCase):
         """Set up the test environment"""
         super().setUpClass()
 
-        # Create log directory structure
-        logs_base_dir = os.path.join(
-            os.path.dirname(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            ),
-            "logs",
-            "test_logs",
-        )
-        os.makedirs(logs_base_dir, exist_ok=True)
+        cls.log_dir = _get_log_dir()
 
-        cls.log_dir = os.path.join(
-            logs_base_dir, f"test_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        )
-        os.makedirs(cls.log_dir, exist_ok=True)
+    # Synthesized audio by (text, voice_id), shared by every test in the run
+    _speech_files = {}
 
     def synthesize_speech(self, text, voice_id=None):
-        """Generate speech audio file from text and track for cleanup.
+        """Generate speech audio file from text.
+
+        The audio comes from the on-disk speech cache, which owns the files,
+        so they are not removed on cleanup and later runs reuse them. Repeats
+        within a run skip even the cache lookup.
 
         Args:
             text (str): Text to convert to speech
@@ -251,12 +497,46 @@ class BaseVoiceTest(BaseTestCase):
         Returns:
             str: Path to the generated audio file
         """
+        key = (text, voice_id)
+        audio_file = BaseVoiceTest._speech_files.get(key)
+        if audio_file is None:
+            from src.tests.common.speech import synthesize_speech
+
+            audio_file = synthesize_speech(text, voice_id)
+            if audio_file:
+                BaseVoiceTest._speech_files[key] = audio_file
+        return audio_file
+
+    def synthesize_speech_batch(self, texts, voice_id=None):
+        """Generate speech audio files for several texts concurrently.
+
+        Synthesis is bound by the TTS server round trip, so the requests run
+        in parallel and a test loop only waits on playback. The workers only
+        synthesize; the memo is updated on the calling thread.
+
+        Args:
+            texts (list): Texts to convert to speech
+            voice_id (str, optional): Voice ID to use for synthesis
+
+        Returns:
+            dict: Path to the generated audio file for each text
+        """
         from src.tests.common.speech import synthesize_speech
 
-        audio_file = synthesize_speech(text, voice_id)
-        if audio_file:
-            self.temp_files.append(audio_file)
-        return audio_file
+        audio_files = {
+            text: BaseVoiceTest._speech_files.get((text, voice_id)) for text in texts
+        }
+        missing = [text for text, audio_file in audio_files.items() if audio_file is None]
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                synthesized = executor.map(
+                    lambda text: synthesize_speech(text, voice_id), missing
+                )
+                for text, audio_file in zip(missing, synthesized):
+                    if audio_file:
+                        BaseVoiceTest._speech_files[(text, voice_id)] = audio_file
+                    audio_files[text] = audio_file
+        return audio_files
 
     def play_audio_file(self, file_path, volume=2):
         """Play an audio file with specified volume.
@@ -273,7 +553,7 @@ class BaseVoiceTest(BaseTestCase):
         play_audio_file(file_path, volume)
 
     def synthesize_and_play(self, text, voice_id=None, volume=2):
-        """Synthesize speech and play it, tracking the file for cleanup.
+        """Synthesize speech and play it.
 
         Args:
             text (str): Text to convert to speech
@@ -281,8 +561,14 @@ class BaseVoiceTest(BaseTestCase):
             volume (int, optional): Volume level for playback
 
         Returns:
-            str: Path to the generated audio file
+            str: Path to the generated audio file, or None if playback is
+                skipped
         """
+        # Nothing would be played, so don't synthesize either
+        if should_skip_audio_playback():
+            logger.info("Audio playback skipped based on environment setting")
+            return None
+
         audio_file = self.synthesize_speech(text, voice_id)
         if audio_file:
             self.play_audio_file(audio_file, volume)
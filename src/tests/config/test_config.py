@@ -192,6 +192,29 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config.get("DICTATION_TIMEOUT"), 15.0)
         self.assertEqual(config.get("USE_NEURAL_VOICE"), True)
 
+    def test_config_file_parse_is_cached(self):
+        """Test that unchanged config files are not parsed again."""
+        with open(self.temp_config_path, "w") as f:
+            json.dump({"MODEL_SIZE": "medium"}, f)
+
+        first = OriginalConfig._read_config_file(self.temp_config_path)
+        with patch("json.load") as mock_load:
+            second = OriginalConfig._read_config_file(self.temp_config_path)
+            mock_load.assert_not_called()
+        self.assertIs(first, second)
+
+        # Rewriting the file invalidates the cached parse
+        with open(self.temp_config_path, "w") as f:
+            json.dump({"MODEL_SIZE": "large"}, f)
+        os.utime(self.temp_config_path, ns=(0, 0))
+
+        third = OriginalConfig._read_config_file(self.temp_config_path)
+        self.assertEqual(third["MODEL_SIZE"], "large")
+
+        # Missing files raise so callers can skip them
+        with self.assertRaises(FileNotFoundError):
+            OriginalConfig._read_config_file(self.temp_config_path + ".missing")
+
     def test_get_with_default(self):
         """Test getting values with defaults."""
         config = TestableConfig()
@@ -100,7 +100,7 @@ class TestCoreDictation(unittest.TestCase):
         # Check results
         self.assertTrue(result)
         self.mock_subprocess.run.assert_called()
-        self.mock_open.assert_called()
+        self.assertEqual(self.mock_subprocess.run.call_args[0][0][-1], "Test text")
         self.mock_play_sound.assert_called_with("Pop")
         self.mock_notify.assert_called()
 
@@ -5,16 +5,36 @@ Provides visual and audible feedback for voice control actions.
 Uses osascript to display notifications for maximum compatibility.
 """
 
+import itertools
+import logging
 import os
 import time
 import subprocess
 import threading
 from typing import Optional
 
+logger = logging.getLogger("toast-notifications")
+
 # Keep track of active notifications
 active_notifications = {}
 notification_lock = threading.Lock()
 
+# Auto-dismiss deadlines (time.monotonic()) by identifier, handled by one
+# long-lived thread instead of a Timer thread per notification. Re-sending
+# an identifier replaces its deadline, so a stale timeout can't dismiss it.
+_dismiss_deadlines = {}
+_dismiss_condition = threading.Condition(notification_lock)
+
+# AppleScript taking the message and title as arguments
+_NOTIFICATION_SCRIPT = """
+on run argv
+    display notification (item 1 of argv) with title (item 2 of argv)
+end run
+"""
+
+# Identifiers stay unique even for several notifications within one second
+_notification_ids = itertools.count()
+
 
 def send_notification(
     title: str,
@@ -39,18 +59,15 @@ def send_notification(
     try:
         # Generate a unique identifier if not provided
         if identifier is None:
-            identifier = f"whisper-voice-control-{int(time.time())}"
-
-        # Skip UserNotifications and go straight to osascript
-        # Escape double quotes in title and message
-        title_escaped = title.replace('"', '\\"')
-        message_escaped = message.replace('"', '\\"')
-
-        script = f"""
-        display notification "{message_escaped}" with title "{title_escaped}"
-        """
+            identifier = f"whisper-voice-control-{os.getpid()}-{next(_notification_ids)}"
 
-        subprocess.run(["osascript", "-e", script], capture_output=True, text=True)
+        # Skip UserNotifications and go straight to osascript; the message and
+        # title are passed as arguments so they need no escaping
+        subprocess.run(
+            ["osascript", "-e", _NOTIFICATION_SCRIPT, "--", message, title],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
 
         # Store in active notifications
         with notification_lock:
@@ -60,14 +77,17 @@ def send_notification(
                 "timestamp": time.time(),
             }
 
-        # Auto-dismiss if timeout > 0
-        if timeout > 0:
-            threading.Timer(timeout, remove_notification, [identifier]).start()
+            # Auto-dismiss if timeout > 0
+            if timeout > 0:
+                _dismiss_deadlines[identifier] = time.monotonic() + timeout
+                _dismiss_condition.notify()
+            else:
+                _dismiss_deadlines.pop(identifier, None)
 
         return identifier
 
     except Exception as e:
-        print(f"Failed to send notification: {e}")
+        logger.error("Failed to send notification: %s", e)
         return ""
 
 
@@ -105,11 +125,11 @@ def remove_notification(identifier: str) -> None:
         # With osascript, we can't directly remove notifications,
         # but we can track them internally
         with notification_lock:
-            if identifier in active_notifications:
-                del active_notifications[identifier]
+            active_notifications.pop(identifier, None)
+            _dismiss_deadlines.pop(identifier, None)
 
     except Exception as e:
-        print(f"Failed to remove notification: {e}")
+        logger.error("Failed to remove notification: %s", e)
 
 
 def remove_all_notifications() -> None:
@@ -118,9 +138,32 @@ def remove_all_notifications() -> None:
         # With osascript, we can only track notifications internally
         with notification_lock:
             active_notifications.clear()
+            _dismiss_deadlines.clear()
 
     except Exception as e:
-        print(f"Failed to remove all notifications: {e}")
+        logger.error("Failed to remove all notifications: %s", e)
+
+
+def _dismiss_expired_notifications() -> None:
+    """Remove notifications as their timeouts pass, sleeping until the next one."""
+    with _dismiss_condition:
+        while True:
+            now = time.monotonic()
+            for identifier, deadline in list(_dismiss_deadlines.items()):
+                if deadline <= now:
+                    del _dismiss_deadlines[identifier]
+                    active_notifications.pop(identifier, None)
+
+            next_deadline = min(_dismiss_deadlines.values(), default=None)
+            _dismiss_condition.wait(
+                None if next_deadline is None else next_deadline - now
+            )
+
+
+_dismiss_thread = threading.Thread(
+    target=_dismiss_expired_notifications, daemon=True, name="notification-dismiss"
+)
+_dismiss_thread.start()
 
 
 # Special notification types for voice control
@@ -13,7 +13,6 @@ import random
 import datetime
 import re
 import shutil
-import subprocess
 from typing import Dict, List, Optional, Tuple, Any
 
 # Import our own modules
@@ -45,61 +44,67 @@ assistant_state = {
     "voice": config.get("NEURAL_VOICE_ID", "p230"),  # Use voice from config
 }
 
-# Predefined responses for various scenarios
+# Predefined responses for various scenarios; tuples since they never change
 RESPONSES = {
-    "greeting": [
+    "greeting": (
         f"Hello, {USER_NAME}. How may I assist you today?",
         f"Good to see you, {USER_NAME}. What can I do for you?",
         f"At your service, {USER_NAME}. How can I help?",
         f"Hello. I'm listening.",
-    ],
-    "farewell": [
+    ),
+    "farewell": (
         f"Goodbye, {USER_NAME}. Call if you need me.",
         "Signing off now. I'll be here when you need me.",
         "Entering standby mode.",
         "I'll be here if you need anything else.",
-    ],
-    "acknowledgment": [
+    ),
+    "acknowledgment": (
         "Right away, sir.",
         "Consider it done.",
         "On it.",
         "I'm on it.",
         "Working on that now.",
-    ],
-    "uncertain": [
+    ),
+    "uncertain": (
         "I'm not sure I understand. Could you rephrase that?",
         "I didn't quite catch that. Could you try again?",
         "I'm afraid I don't know how to help with that.",
         "I'm still learning and don't know how to do that yet.",
-    ],
-    "time": [
+    ),
+    "time": (
         "It's currently {time}.",
         "The time is {time}.",
         "Right now it's {time}.",
-    ],
-    "date": [
+    ),
+    "date": (
         "Today is {date}.",
         "It's {date} today.",
         "The date is {date}.",
-    ],
-    "status": [
+    ),
+    "status": (
         "All systems operational.",
         "Everything is running smoothly.",
         "Systems are functioning normally.",
         "All processes running within normal parameters.",
-    ],
-    "weather_placeholder": [
+    ),
+    "weather_placeholder": (
         "I'm afraid I don't have access to current weather data.",
         "I can't check the weather at the moment.",
         "Weather information is not available right now.",
-    ],
-    "joke": [
+    ),
+    "activation": (
+        f"How can I assist you today, {USER_NAME}?",
+        f"What can I help you with, {USER_NAME}?",
+        f"I'm at your service. What do you need?",
+        f"Ready and listening. What would you like me to do?",
+    ),
+    "joke": (
         "Why don't scientists trust atoms? Because they make up everything.",
         "I'm reading a book about anti-gravity. It's impossible to put down.",
         "Did you hear about the mathematician who's afraid of negative numbers? He'll stop at nothing to avoid them.",
         "Why was the computer cold? It left its Windows open.",
         "What do you call a fake noodle? An impasta.",
-    ],
+    ),
 }
 
 # Command patterns for natural language understanding
@@ -132,6 +137,13 @@ COMMAND_PATTERNS = [
     (r"\bthanks?\b", "acknowledge_thanks"),
 ]
 
+# Patterns compiled once at import instead of looked up on every input
+_COMMAND_REGEXES = [
+    (re.compile(pattern), command_name) for pattern, command_name in COMMAND_PATTERNS
+]
+_GO_TO_SLEEP_RE = re.compile(r"\bgo to sleep\b")
+_WAKE_UP_RE = re.compile(r"\bwake up\b")
+
 
 def add_to_memory(role: str, content: str) -> None:
     """Add an interaction to the conversation memory.
@@ -187,7 +199,9 @@ def activate_assistant(voice: str = None) -> None:
 
     # Play a distinct sound to indicate activation
     try:
-        subprocess.run(["afplay", "/System/Library/Sounds/Submarine.aiff"], check=False)
+        from src.audio.resource_manager import play_system_sound
+
+        play_system_sound("Submarine", block=True)
     except Exception:
         pass
 
@@ -195,14 +209,7 @@ def activate_assistant(voice: str = None) -> None:
     time.sleep(0.3)
 
     # Proactively ask what the user wants (starting the conversation)
-    question = random.choice(
-        [
-            f"How can I assist you today, {USER_NAME}?",
-            f"What can I help you with, {USER_NAME}?",
-            f"I'm at your service. What do you need?",
-            f"Ready and listening. What would you like me to do?",
-        ]
-    )
+    question = random.choice(RESPONSES["activation"])
 
     # Speak the question
     update_status(f"{ASSISTANT_NAME} speaking: '{question}'")
@@ -243,7 +250,9 @@ def deactivate_assistant() -> None:
 
     # Play a sound to indicate deactivation
     try:
-        subprocess.run(["afplay", "/System/Library/Sounds/Submarine.aiff"], check=False)
+        from src.audio.resource_manager import play_system_sound
+
+        play_system_sound("Submarine", block=True)
     except Exception:
         pass
 
@@ -264,7 +273,7 @@ def handle_user_input(text: str) -> str:
     clean_text = text.strip().lower()
 
     # Check for explicit wake/sleep commands first
-    if re.search(r"\bgo to sleep\b", clean_text):
+    if _GO_TO_SLEEP_RE.search(clean_text):
         response = random.choice(RESPONSES["farewell"])
         add_to_memory("assistant", response)
 
@@ -273,7 +282,7 @@ def handle_user_input(text: str) -> str:
         deactivate_assistant()
         return response
 
-    if re.search(r"\bwake up\b", clean_text) and not assistant_state["active"]:
+    if _WAKE_UP_RE.search(clean_text) and not assistant_state["active"]:
         response = random.choice(RESPONSES["greeting"])
         add_to_memory("assistant", response)
 
@@ -282,8 +291,8 @@ def handle_user_input(text: str) -> str:
         return response
 
     # Try to match a command pattern
-    for pattern, command_name in COMMAND_PATTERNS:
-        if re.search(pattern, clean_text):
+    for regex, command_name in _COMMAND_REGEXES:
+        if regex.search(clean_text):
             # Found a matching command
             response = execute_command(command_name, clean_text)
             add_to_memory("assistant", response)
@@ -388,6 +397,22 @@ def list_abilities() -> str:
     return f"Here's what I can do: {'. '.join(capabilities)}."
 
 
+def fixed_responses() -> List[str]:
+    """Get the predefined responses that need no runtime formatting.
+
+    These are spoken verbatim, so their audio can be synthesized ahead of time.
+
+    Returns:
+        List of response strings without {placeholders}
+    """
+    return [
+        response
+        for responses in RESPONSES.values()
+        for response in responses
+        if "{" not in response
+    ]
+
+
 def update_status(status: str) -> None:
     """Update the status display in the terminal.
 
@@ -419,6 +444,24 @@ def update_status(status: str) -> None:
     sys.stdout.flush()
 
 
+def _play_acknowledgment_sound(block: bool = False) -> None:
+    """Play the acknowledgment sound, by default without waiting for it.
+
+    The sound only confirms we heard the user, so the response is generated
+    while it plays instead of after afplay exits.
+
+    Args:
+        block: Wait for the sound to finish, so a following sound doesn't
+            overlap it
+    """
+    try:
+        from src.audio.resource_manager import play_system_sound
+
+        play_system_sound("Pop", block=block)
+    except Exception:
+        pass
+
+
 def process_voice_command(transcription: str) -> None:
     """Process a voice command from the main voice control system.
 
@@ -434,13 +477,9 @@ def process_voice_command(transcription: str) -> None:
             transcription.lower().startswith(WAKE_WORD)
             or "jarvis" in transcription.lower()
         ):
-            # Play sound to indicate we heard the wake word
-            try:
-                subprocess.run(
-                    ["afplay", "/System/Library/Sounds/Pop.aiff"], check=False
-                )
-            except Exception:
-                pass
+            # Play sound to indicate we heard the wake word, finishing before
+            # the activation chime starts
+            _play_acknowledgment_sound(block=True)
 
             # Activate assistant
             activate_assistant()
@@ -460,10 +499,7 @@ def process_voice_command(transcription: str) -> None:
     update_status(f"Processing command: '{transcription}'")
 
     # First play an acknowledgment sound so user knows we heard them
-    try:
-        subprocess.run(["afplay", "/System/Library/Sounds/Pop.aiff"], check=False)
-    except Exception:
-        pass
+    _play_acknowledgment_sound()
 
     # Generate response
     response = handle_user_input(transcription)
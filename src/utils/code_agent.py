@@ -3,7 +3,8 @@ import json
 import logging
 import threading
 import time
-from typing import Dict, List, Optional
+from collections import deque
+from typing import Deque, Dict, Optional
 
 from src.audio.speech_synthesis import speak
 from src.core.state_manager import StateManager
@@ -25,8 +26,10 @@ class CodeAgentHandler:
         self.active_sessions: Dict[str, Dict] = {}
         self.running = False
 
-        # Queue for requests
-        self.request_queue: List[Dict] = []
+        # Queue for requests; the condition wakes the processing thread when
+        # a request arrives or the handler stops, so it never has to poll
+        self.request_queue: Deque[Dict] = deque()
+        self._queue_condition = threading.Condition()
 
         # Thread for processing requests
         self.processing_thread = None
@@ -46,7 +49,9 @@ class CodeAgentHandler:
 
     def stop(self):
         """Stop the Code Agent handler."""
-        self.running = False
+        with self._queue_condition:
+            self.running = False
+            self._queue_condition.notify_all()
         if self.processing_thread:
             self.processing_thread.join(timeout=1.0)
         logger.info("Code Agent handler stopped")
@@ -81,26 +86,28 @@ class CodeAgentHandler:
         })
 
         # Add to request queue
-        self.request_queue.append({
-            "id": request_id,
-            "prompt": prompt,
-            "session_id": session_id,
-            "submitted_at": time.time(),
-        })
+        with self._queue_condition:
+            self.request_queue.append({
+                "id": request_id,
+                "prompt": prompt,
+                "session_id": session_id,
+                "submitted_at": time.time(),
+            })
+            self._queue_condition.notify()
 
         logger.info(f"Request {request_id} submitted for session {session_id}")
         return request_id
 
     def _process_requests_loop(self):
         """Process requests in the queue."""
-        while self.running:
-            if not self.request_queue:
-                # Sleep if queue is empty
-                time.sleep(0.1)
-                continue
-
-            # Get the next request
-            request = self.request_queue.pop(0)
+        while True:
+            # Wait for the next request
+            with self._queue_condition:
+                while self.running and not self.request_queue:
+                    self._queue_condition.wait()
+                if not self.running:
+                    return
+                request = self.request_queue.popleft()
 
             try:
                 # Process the request
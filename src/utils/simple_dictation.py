@@ -65,8 +65,8 @@ class SimpleAudioRecorder:
         logger.info(f"Starting recording for {duration} seconds...")
         RECORDING = True
 
-        # Play start sound
-        play_system_sound("Tink")
+        # Play start sound, letting it finish before the microphone opens
+        play_system_sound("Tink", block=True)
 
         # Create a temporary WAV file
         temp_file = TempAudioFile(delete=False)